@@ -2,6 +2,7 @@
 Authentication API Routes for NovaPress AI v2
 JWT-based auth with PostgreSQL user storage.
 """
+import asyncio
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
@@ -165,7 +166,7 @@ async def register(body: RegisterRequest, db: AsyncSession = Depends(get_db)):
         id=uuid.uuid4(),
         email=body.email,
         name=body.name,
-        hashed_password=get_password_hash(body.password),
+        hashed_password=await asyncio.to_thread(get_password_hash, body.password),
         avatar_url=None,
         subscription_tier="free",
         preferences=_default_preferences(),
@@ -203,8 +204,11 @@ async def login(body: LoginRequest, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(User).where(User.email == body.email))
     user = result.scalar_one_or_none()
 
-    # Generic message: never reveal whether the email exists
-    if user is None or not verify_password(body.password, user.hashed_password):
+    # Generic message: never reveal whether the email exists.
+    # bcrypt is CPU-bound (~100 ms): run it in the threadpool, not on the event loop.
+    if user is None or not await asyncio.to_thread(
+        verify_password, body.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
@@ -355,13 +359,15 @@ async def change_password(
     Change the authenticated user's password.
     Requires the current password for verification.
     """
-    if not verify_password(body.currentPassword, current_user.hashed_password):
+    if not await asyncio.to_thread(
+        verify_password, body.currentPassword, current_user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Current password is incorrect",
         )
 
-    current_user.hashed_password = get_password_hash(body.newPassword)
+    current_user.hashed_password = await asyncio.to_thread(get_password_hash, body.newPassword)
     current_user.updated_at = datetime.now(timezone.utc)
 
     logger.info(f"User changed password: {current_user.email}")
@@ -378,13 +384,15 @@ async def change_password_alias(
     Alias for POST /change-password.
     The frontend authService calls /auth/profile/password.
     """
-    if not verify_password(body.currentPassword, current_user.hashed_password):
+    if not await asyncio.to_thread(
+        verify_password, body.currentPassword, current_user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Current password is incorrect",
         )
 
-    current_user.hashed_password = get_password_hash(body.newPassword)
+    current_user.hashed_password = await asyncio.to_thread(get_password_hash, body.newPassword)
     current_user.updated_at = datetime.now(timezone.utc)
 
     logger.info(f"User changed password (alias): {current_user.email}")
@@ -69,6 +69,10 @@ class Settings(BaseSettings):
     EMBEDDING_DEVICE: str = "cpu"  # or "cuda" if GPU available
     EMBEDDING_BATCH_SIZE: int = 32
     EMBEDDING_DIMENSION: int = 1024
+    # Inference backend: "torch" (default), "onnx" or "openvino" (CPU, 2-4x faster encode)
+    EMBEDDING_BACKEND: str = "torch"
+    # Optional model file for onnx/openvino, e.g. "onnx/model_qint8_avx512_vnni.onnx" (INT8)
+    EMBEDDING_MODEL_FILE: str = ""
 
     # Scraping
     USER_AGENT: str = "NovaPress/2.0 (+https://novapress.ai)"
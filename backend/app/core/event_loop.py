@@ -0,0 +1,29 @@
+"""
+NovaPress AI - Event loop policy for the asyncio driver scripts
+
+Usage:
+    from app.core.event_loop import install_fast_event_loop
+
+    install_fast_event_loop()
+    asyncio.run(main())
+"""
+import sys
+
+
+def install_fast_event_loop() -> bool:
+    """
+    Install uvloop (winloop on Windows) as the asyncio event loop when available.
+
+    uvloop ships with uvicorn[standard]; without it the default loop is kept.
+    Call before asyncio.run(). Returns True if a faster loop was installed.
+    """
+    try:
+        if sys.platform == "win32":
+            import winloop
+            winloop.install()
+        else:
+            import uvloop
+            uvloop.install()
+    except ImportError:
+        return False
+    return True
@@ -15,10 +15,38 @@ from qdrant_client.models import (
     Range
 )
 from loguru import logger
+import json
 import uuid
 
 from app.core.config import settings
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(obj: Any) -> str:
+    """
+    Serialize a payload value (causal graphs) to a JSON string.
+
+    Uses orjson when installed (faster, and serializes numpy arrays/scalars
+    without a .tolist() copy); falls back to the stdlib otherwise.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(data: str) -> Any:
+    """Parse a JSON payload string. orjson.JSONDecodeError subclasses json.JSONDecodeError."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class QdrantService:
     """Qdrant Vector Database Service"""
@@ -651,9 +679,7 @@ class QdrantService:
             return False
 
         except Exception as e:
-            logger.error(f"Failed to update article synthesis link: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Failed to update article synthesis link: {e}")
             return False
 
     def get_articles_excluding_used(
@@ -906,7 +932,7 @@ class QdrantService:
         import json
         causal_graph = synthesis.get("causal_graph", {})
         if isinstance(causal_graph, dict):
-            causal_graph_str = json.dumps(causal_graph)
+            causal_graph_str = _json_dumps(causal_graph)
         else:
             causal_graph_str = "{}"
 
@@ -1083,7 +1109,7 @@ class QdrantService:
                 "narrative_flow": narrative_flow,
                 "predictions": formatted_predictions  # Future predictions
             }
-            causal_graph_str = json.dumps(causal_graph)
+            causal_graph_str = _json_dumps(causal_graph)
 
         point = PointStruct(
             id=point_id,
@@ -1306,7 +1332,7 @@ class QdrantService:
                 causal_graph_str = synthesis.get("causal_graph", "{}")
                 if causal_graph_str and isinstance(causal_graph_str, str):
                     try:
-                        synthesis["causal_graph"] = json.loads(causal_graph_str)
+                        synthesis["causal_graph"] = _json_loads(causal_graph_str)
                     except json.JSONDecodeError:
                         synthesis["causal_graph"] = {"nodes": [], "edges": [], "central_entity": "", "narrative_flow": "linear"}
                 else:
@@ -1548,7 +1574,7 @@ class QdrantService:
                 causal_graph_str = synthesis.get("causal_graph", "{}")
                 if causal_graph_str and isinstance(causal_graph_str, str):
                     try:
-                        synthesis["causal_graph"] = json.loads(causal_graph_str)
+                        synthesis["causal_graph"] = _json_loads(causal_graph_str)
                     except json.JSONDecodeError:
                         synthesis["causal_graph"] = {"nodes": [], "edges": []}
                 else:
@@ -1990,7 +2016,7 @@ class QdrantService:
                 causal_graph_str = synthesis.get("causal_graph", "{}")
                 if causal_graph_str and isinstance(causal_graph_str, str):
                     try:
-                        synthesis["causal_graph"] = json.loads(causal_graph_str)
+                        synthesis["causal_graph"] = _json_loads(causal_graph_str)
                     except json.JSONDecodeError:
                         synthesis["causal_graph"] = {"nodes": [], "edges": []}
 
@@ -2415,6 +2441,142 @@ class QdrantService:
             logger.error(f"Failed to update entity mentions: {e}")
             return False
 
+    def bulk_update_entity_mentions(
+        self,
+        mentions: Dict[str, List[str]]
+    ) -> int:
+        """
+        Append synthesis mentions to many entities in two round-trips.
+
+        Equivalent to calling update_entity_mentions(entity_id, synthesis_id)
+        for every pair, but reads all payloads with one retrieve and writes
+        every update with one batch of set_payload operations (vectors are
+        left untouched).
+
+        Args:
+            mentions: Mapping entity_id -> synthesis IDs mentioning it
+
+        Returns:
+            Number of entities updated
+        """
+        if not self.client:
+            raise RuntimeError("Qdrant not initialized")
+
+        if not mentions:
+            return 0
+
+        try:
+            import json
+            from datetime import datetime
+
+            points = self.client.retrieve(
+                collection_name=self.entities_collection,
+                ids=list(mentions.keys()),
+                with_payload=["synthesis_ids"],
+                with_vectors=False
+            )
+
+            now = datetime.now().timestamp()
+            operations = []
+            for point in points:
+                synthesis_ids_str = point.payload.get("synthesis_ids", "[]")
+                try:
+                    synthesis_ids = json.loads(synthesis_ids_str) if isinstance(synthesis_ids_str, str) else []
+                except json.JSONDecodeError:
+                    synthesis_ids = []
+
+                for synthesis_id in mentions.get(str(point.id), []):
+                    if synthesis_id not in synthesis_ids:
+                        synthesis_ids.append(synthesis_id)
+
+                operations.append(models.SetPayloadOperation(
+                    set_payload=models.SetPayload(
+                        payload={
+                            "synthesis_ids": json.dumps(synthesis_ids)[:5000],
+                            "mention_count": len(synthesis_ids),
+                            "last_seen": now,
+                        },
+                        points=[point.id]
+                    )
+                ))
+
+            if operations:
+                self.client.batch_update_points(
+                    collection_name=self.entities_collection,
+                    update_operations=operations
+                )
+
+            return len(operations)
+
+        except Exception as e:
+            logger.error(f"Failed to bulk update entity mentions: {e}")
+            return 0
+
+    def bulk_update_entity_relationships(
+        self,
+        related: Dict[str, List[str]]
+    ) -> int:
+        """
+        Append related entity IDs to many entities in two round-trips.
+
+        Reads the related_entities payload of every entity with one retrieve
+        and writes all updates with one batch of set_payload operations.
+
+        Args:
+            related: Mapping entity_id -> IDs of entities co-occurring with it
+
+        Returns:
+            Number of entities updated
+        """
+        if not self.client:
+            raise RuntimeError("Qdrant not initialized")
+
+        if not related:
+            return 0
+
+        try:
+            import json
+
+            points = self.client.retrieve(
+                collection_name=self.entities_collection,
+                ids=list(related.keys()),
+                with_payload=["related_entities"],
+                with_vectors=False
+            )
+
+            operations = []
+            for point in points:
+                related_str = point.payload.get("related_entities", "[]")
+                try:
+                    related_ids = json.loads(related_str) if isinstance(related_str, str) else []
+                except json.JSONDecodeError:
+                    related_ids = []
+
+                for other_id in related.get(str(point.id), []):
+                    if other_id not in related_ids:
+                        related_ids.append(other_id)
+
+                operations.append(models.SetPayloadOperation(
+                    set_payload=models.SetPayload(
+                        payload={
+                            "related_entities": json.dumps(related_ids[:50])[:2000],  # Top 50 relations
+                        },
+                        points=[point.id]
+                    )
+                ))
+
+            if operations:
+                self.client.batch_update_points(
+                    collection_name=self.entities_collection,
+                    update_operations=operations
+                )
+
+            return len(operations)
+
+        except Exception as e:
+            logger.error(f"Failed to bulk update entity relationships: {e}")
+            return 0
+
     # =========================================================================
     # INTELLIGENCE HUB: TOPICS
     # =========================================================================
@@ -2454,7 +2616,7 @@ class QdrantService:
 
         # Store merged causal graph as JSON
         merged_causal_graph = topic.get("merged_causal_graph", {})
-        causal_graph_str = json.dumps(merged_causal_graph) if isinstance(merged_causal_graph, dict) else "{}"
+        causal_graph_str = _json_dumps(merged_causal_graph) if isinstance(merged_causal_graph, dict) else "{}"
 
         point = PointStruct(
             id=point_id,
@@ -2470,6 +2632,7 @@ class QdrantService:
                 "entity_ids": entity_ids_str[:5000],
                 "narrative_arc": str(topic.get("narrative_arc", "emerging"))[:20],
                 "merged_causal_graph": causal_graph_str[:20000],
+                "synthesis_ids_hash": str(topic.get("synthesis_ids_hash", ""))[:64],
                 "mention_count": int(topic.get("mention_count", 1)),
                 "is_active": bool(topic.get("is_active", True)),
                 "created_at": datetime.now().timestamp()
@@ -2517,7 +2680,7 @@ class QdrantService:
                 causal_str = topic.get("merged_causal_graph", "{}")
                 if isinstance(causal_str, str):
                     try:
-                        topic["merged_causal_graph"] = json.loads(causal_str)
+                        topic["merged_causal_graph"] = _json_loads(causal_str)
                     except json.JSONDecodeError:
                         topic["merged_causal_graph"] = {"nodes": [], "edges": []}
 
@@ -2724,7 +2887,8 @@ class QdrantService:
     def update_topic_causal_graph(
         self,
         topic_id: str,
-        causal_graph: Dict[str, Any]
+        causal_graph: Dict[str, Any],
+        synthesis_ids_hash: Optional[str] = None
     ) -> bool:
         """
         Update the merged causal graph for a topic.
@@ -2732,6 +2896,7 @@ class QdrantService:
         Args:
             topic_id: The topic ID
             causal_graph: The aggregated causal graph
+            synthesis_ids_hash: Hash of the synthesis set the graph was built from
 
         Returns:
             Success status
@@ -2749,6 +2914,8 @@ class QdrantService:
 
             topic["merged_causal_graph"] = causal_graph
             topic["last_updated"] = datetime.now().timestamp()
+            if synthesis_ids_hash is not None:
+                topic["synthesis_ids_hash"] = synthesis_ids_hash
 
             # Re-upsert
             result = self.client.retrieve(
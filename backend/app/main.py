@@ -15,7 +15,7 @@ if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
 from loguru import logger
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -199,20 +199,25 @@ app.add_middleware(
 
 
 # Health Checks - Kubernetes compatible
+# Static payloads, serialized once: probes are polled constantly
+_HEALTH_BODY = JSONResponse({
+    "status": "healthy",
+    "version": "2.0.0",
+    "stack": "100% Open Source (NO Gemini)"
+}).body
+_LIVENESS_BODY = JSONResponse({"status": "alive"}).body
+
+
 @app.get("/health")
 async def health_check():
     """Basic health check - always returns 200 if app is running"""
-    return JSONResponse({
-        "status": "healthy",
-        "version": "2.0.0",
-        "stack": "100% Open Source (NO Gemini)"
-    })
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/health/live")
 async def liveness_check():
     """Liveness probe - indicates if application is alive and should not be restarted"""
-    return JSONResponse({"status": "alive"})
+    return Response(content=_LIVENESS_BODY, media_type="application/json")
 
 
 @app.get("/health/ready")
@@ -7,12 +7,64 @@ Uses sklearn.cluster.HDBSCAN (built-in since sklearn 1.3+)
 from typing import List, Dict, Any, Tuple
 import numpy as np
 from sklearn.preprocessing import normalize
-from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.cluster import HDBSCAN
 from loguru import logger
 
 from app.core.config import settings
 
+# Optional: JIT kernel for the coherence of small clusters
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many rows a cluster's coherence uses the JIT loop: the GEMM's
+# BLAS dispatch costs more than the few dot products it computes
+SMALL_CLUSTER_JIT_MAX = 8
+
+
+def _l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """Row-wise L2 normalization in contiguous float32 (zero rows stay zero)."""
+    x = np.ascontiguousarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    return x / np.where(norms == 0, 1.0, norms)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _mean_pairwise_dot(x):
+        """Mean dot product over distinct pairs of rows (rows pre-normalized)."""
+        n, d = x.shape
+        total = 0.0
+        for i in range(n):
+            for j in range(i + 1, n):
+                dot = 0.0
+                for k in range(d):
+                    dot += x[i, k] * x[j, k]
+                total += dot
+        return total / (n * (n - 1) / 2)
+
+
+def _mean_pairwise_similarity(vectors: np.ndarray, normalized: bool = False) -> float:
+    """
+    Mean cosine similarity over all distinct pairs (strict upper triangle).
+
+    Rows are L2-normalized once in contiguous float32 (skipped when the caller
+    already did it) and the similarity matrix is a single BLAS GEMM; the
+    off-diagonal sum is the full sum minus the trace. Small clusters use the
+    numba loop instead when available. Zero vectors have similarity 0, like
+    cosine_similarity.
+    """
+    x = vectors if normalized else _l2_normalize(vectors)
+    n = len(x)
+
+    if NUMBA_AVAILABLE and n < SMALL_CLUSTER_JIT_MAX:
+        return float(_mean_pairwise_dot(np.ascontiguousarray(x)))
+
+    sim_matrix = x @ x.T
+    return float((sim_matrix.sum() - np.trace(sim_matrix)) / (n * (n - 1)))
+
 
 class ClusteringEngine:
     """HDBSCAN Clustering for Articles with Thematic Coherence"""
@@ -28,11 +80,15 @@ class ClusteringEngine:
         self,
         embeddings: np.ndarray,
         cluster_labels: np.ndarray,
-        cluster_id: int
+        cluster_id: int,
+        normalized: bool = False
     ) -> float:
         """
         Compute average pairwise cosine similarity within a cluster.
         Higher = more thematically coherent.
+
+        Pass normalized=True when the rows are already L2-normalized (e.g.
+        from _l2_normalize) so repeated calls don't renormalize them.
         """
         mask = cluster_labels == cluster_id
         cluster_embeddings = embeddings[mask]
@@ -40,14 +96,7 @@ class ClusteringEngine:
         if len(cluster_embeddings) < 2:
             return 1.0
 
-        # Compute pairwise cosine similarity
-        sim_matrix = cosine_similarity(cluster_embeddings)
-
-        # Get upper triangle (excluding diagonal)
-        n = len(sim_matrix)
-        upper_tri = sim_matrix[np.triu_indices(n, k=1)]
-
-        return float(np.mean(upper_tri))
+        return _mean_pairwise_similarity(cluster_embeddings, normalized=normalized)
 
     def _sub_cluster(
         self,
@@ -85,10 +134,7 @@ class ClusteringEngine:
             if sub_size >= 2:
                 sub_embeddings = cluster_embeddings[sub_mask]
                 if len(sub_embeddings) >= 2:
-                    sim_matrix = cosine_similarity(sub_embeddings)
-                    n = len(sim_matrix)
-                    upper_tri = sim_matrix[np.triu_indices(n, k=1)]
-                    coherence = float(np.mean(upper_tri))
+                    coherence = _mean_pairwise_similarity(sub_embeddings)
 
                     # Accept sub-cluster if coherent enough
                     if coherence >= self.min_cluster_similarity - 0.1:  # Slightly relaxed
@@ -109,23 +155,31 @@ class ClusteringEngine:
         Validate clusters and mark incoherent ones as noise (-1).
         Sub-clusters oversized clusters instead of discarding them.
         """
+        # Normalize once; each cluster's rows are then a contiguous slice of
+        # the label-sorted order instead of a full-length mask per cluster
+        normalized = _l2_normalize(embeddings)
+        order = np.argsort(cluster_labels, kind='stable')
+        labels_sorted, starts, sizes = np.unique(
+            cluster_labels[order], return_index=True, return_counts=True
+        )
+
         filtered_labels = cluster_labels.copy()
-        unique_clusters = set(cluster_labels) - {-1}
 
         clusters_removed = 0
         clusters_split = 0
         next_label = max(cluster_labels) + 1  # For new sub-clusters
 
-        for cluster_id in unique_clusters:
-            cluster_mask = cluster_labels == cluster_id
-            cluster_size = np.sum(cluster_mask)
-            coherence = self._compute_cluster_coherence(embeddings, cluster_labels, cluster_id)
+        for cluster_id, start, cluster_size in zip(labels_sorted, starts, sizes):
+            if cluster_id == -1:
+                continue
+            members = order[start:start + cluster_size]
 
             # Check if cluster is too large - try sub-clustering instead of rejecting
             if cluster_size > self.max_cluster_size:
                 logger.info(f"🔀 Cluster {cluster_id} too large ({cluster_size}), attempting sub-clustering...")
 
                 # Try to sub-cluster
+                cluster_mask = cluster_labels == cluster_id
                 new_labels, sub_count = self._sub_cluster(embeddings, cluster_mask, next_label)
 
                 if sub_count > 0:
@@ -146,9 +200,14 @@ class ClusteringEngine:
                     logger.warning(f"⚠️ Cluster {cluster_id} could not be sub-clustered, marking as noise")
                 continue
 
+            coherence = (
+                _mean_pairwise_similarity(normalized[members], normalized=True)
+                if cluster_size >= 2 else 1.0
+            )
+
             if coherence < min_similarity:
                 # Mark all articles in this cluster as noise
-                filtered_labels[cluster_mask] = -1
+                filtered_labels[members] = -1
                 clusters_removed += 1
                 logger.warning(f"⚠️ Cluster {cluster_id} removed (coherence={coherence:.3f} < {min_similarity})")
             else:
@@ -178,12 +237,19 @@ class ClusteringEngine:
         Returns:
             Tuple of (cluster_labels, cluster_stats)
         """
+        # Tiny batches never reach normalize/HDBSCAN: they stay one group (label 0)
         if len(embeddings) < 3:
             logger.warning("Not enough articles for clustering")
-            return np.zeros(len(embeddings), dtype=int), {"num_clusters": 0}
+            return np.zeros(len(embeddings), dtype=int), {
+                "num_clusters": 0,
+                "num_noise": 0,
+                "cluster_sizes": {},
+                "cluster_coherences": {},
+                "cluster_probabilities": []
+            }
 
-        # Normalize embeddings
-        embeddings_norm = normalize(embeddings)
+        # Normalize embeddings (float32: half the bytes for the coherence GEMMs)
+        embeddings_norm = normalize(np.ascontiguousarray(embeddings, dtype=np.float32))
 
         # HDBSCAN clustering with stricter parameters (sklearn built-in)
         clusterer = HDBSCAN(
@@ -208,10 +274,11 @@ class ClusteringEngine:
                 self.min_cluster_similarity
             )
 
-        # Compute cluster statistics
-        unique_labels = set(cluster_labels)
-        num_clusters = len([l for l in unique_labels if l != -1])
-        num_noise = list(cluster_labels).count(-1)
+        # Compute cluster statistics (one counting pass over the labels)
+        label_ids, label_counts = np.unique(cluster_labels, return_counts=True)
+        is_cluster = label_ids != -1
+        num_clusters = int(is_cluster.sum())
+        num_noise = int(label_counts[~is_cluster].sum())
 
         stats = {
             "num_clusters": num_clusters,
@@ -222,12 +289,12 @@ class ClusteringEngine:
         }
 
         # Count articles per cluster and compute coherence
-        for label in unique_labels:
-            if label != -1:
-                count = list(cluster_labels).count(label)
-                coherence = self._compute_cluster_coherence(embeddings_norm, cluster_labels, label)
-                stats["cluster_sizes"][int(label)] = count
-                stats["cluster_coherences"][int(label)] = round(coherence, 3)
+        for label, count in zip(label_ids[is_cluster], label_counts[is_cluster]):
+            coherence = self._compute_cluster_coherence(
+                embeddings_norm, cluster_labels, label, normalized=True
+            )
+            stats["cluster_sizes"][int(label)] = int(count)
+            stats["cluster_coherences"][int(label)] = round(coherence, 3)
 
         logger.info(f"✅ Clustering complete: {num_clusters} coherent clusters, {num_noise} noise points")
 
@@ -5,6 +5,7 @@ BAAI/bge-m3: 1024-dimensional multilingual embeddings
 Includes Redis caching for performance optimization
 """
 from sentence_transformers import SentenceTransformer
+from functools import lru_cache
 from typing import List, Optional
 import torch
 import numpy as np
@@ -19,6 +20,27 @@ EMBEDDING_CACHE_TTL = 60 * 60 * 24 * 7  # 7 days
 EMBEDDING_CACHE_PREFIX = "emb:"
 
 
+@lru_cache(maxsize=1)
+def _load_model(model_name: str, device: str, backend: str = "torch", model_file: str = "") -> SentenceTransformer:
+    """
+    Load the SentenceTransformer once per process (shared by every initialize()).
+
+    backend="onnx"/"openvino" runs inference through ONNX Runtime / OpenVINO;
+    with model_file pointing to a quantized export (e.g. INT8) encode is
+    2-4x faster on CPU. Requires sentence-transformers[onnx] / [openvino].
+    """
+    if backend == "torch":
+        return SentenceTransformer(model_name, device=device)
+
+    model_kwargs = {"file_name": model_file} if model_file else None
+    return SentenceTransformer(
+        model_name,
+        device=device,
+        backend=backend,
+        model_kwargs=model_kwargs
+    )
+
+
 class EmbeddingService:
     """BGE-M3 Embedding Service with Redis caching"""
 
@@ -34,6 +56,11 @@ class EmbeddingService:
 
     async def initialize(self):
         """Load BGE-M3 model and connect to Redis with graceful fallback"""
+        # Already initialized in this process: nothing to reload
+        if self.model is not None:
+            logger.debug("BGE-M3 already loaded, skipping initialization")
+            return
+
         # Initialize Redis cache
         try:
             self._redis = redis.from_url(settings.REDIS_URL, decode_responses=False)
@@ -45,12 +72,15 @@ class EmbeddingService:
 
         # Load embedding model
         try:
-            logger.info(f"Loading BGE-M3 model: {settings.EMBEDDING_MODEL}")
-            self.model = SentenceTransformer(
+            backend = settings.EMBEDDING_BACKEND.lower().strip() or "torch"
+            logger.info(f"Loading BGE-M3 model: {settings.EMBEDDING_MODEL} (backend={backend})")
+            self.model = _load_model(
                 settings.EMBEDDING_MODEL,
-                device=self.device
+                self.device,
+                backend,
+                settings.EMBEDDING_MODEL_FILE
             )
-            logger.success(f"✅ BGE-M3 loaded on {self.device}")
+            logger.success(f"✅ BGE-M3 loaded on {self.device} ({backend})")
             self._fallback_mode = False
         except Exception as e:
             logger.warning(f"⚠️ Failed to load embedding model: {e}")
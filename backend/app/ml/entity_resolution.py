@@ -7,6 +7,7 @@ Resolves entity mentions to canonical entities using:
 """
 from typing import List, Dict, Any, Optional, Tuple, Set
 from collections import defaultdict
+import asyncio
 import re
 import unicodedata
 from loguru import logger
@@ -170,11 +171,65 @@ class EntityResolutionService:
         max_len = max(len1, len2)
         return 1.0 - (distance / max_len)
 
+    @staticmethod
+    def _embedding_text(mention: str, entity_type: str, context: str = "") -> str:
+        """Text embedded for semantic matching and stored with new entities."""
+        if not context:
+            return f"{mention} {entity_type}"
+        return f"{mention} {entity_type} {context[:100]}"
+
+    def precompute_embeddings(
+        self,
+        mentions: List[Tuple[str, str]],
+        contexts: List[str]
+    ) -> List[Optional[Any]]:
+        """
+        Encode all mentions in a single batched call before resolution.
+
+        Mentions already in the session cache are skipped (they never reach the
+        semantic stage). Returns one embedding per mention, or None when the
+        resolver should fall back to encoding on demand.
+
+        Args:
+            mentions: List of (mention_text, entity_type) tuples
+            contexts: Context string for each mention
+
+        Returns:
+            List of embeddings aligned with mentions
+        """
+        embeddings: List[Optional[Any]] = [None] * len(mentions)
+        if not self.embedding_service or not mentions:
+            return embeddings
+
+        texts = []
+        indices = []
+        for i, ((mention, entity_type), context) in enumerate(zip(mentions, contexts)):
+            normalized = self.normalize_entity(mention)
+            if f"{entity_type}:{normalized}" in self._resolution_cache:
+                continue
+            if normalized in self.COMMON_ALIASES:
+                mention = self.COMMON_ALIASES[normalized]
+            texts.append(self._embedding_text(mention, entity_type, context))
+            indices.append(i)
+
+        if not texts:
+            return embeddings
+
+        try:
+            encoded = self.embedding_service.encode(texts, batch_size=64)
+            for idx, embedding in zip(indices, encoded):
+                embeddings[idx] = embedding
+        except Exception as e:
+            logger.warning(f"Batch mention encoding failed, falling back to per-mention: {e}")
+
+        return embeddings
+
     async def resolve_entity(
         self,
         mention: str,
         entity_type: str,
-        context: str = ""
+        context: str = "",
+        embedding: Optional[Any] = None
     ) -> Tuple[str, bool]:
         """
         Resolve a mention to an existing entity or create new.
@@ -191,6 +246,7 @@ class EntityResolutionService:
             mention: The entity mention text
             entity_type: Type (PERSON, ORG, GPE, LOC, EVENT, PRODUCT)
             context: Optional context for better disambiguation
+            embedding: Optional precomputed embedding (see precompute_embeddings)
 
         Returns:
             (entity_id, is_new) - entity_id and whether it was newly created
@@ -254,13 +310,15 @@ class EntityResolutionService:
                 return entity_id, False
 
         # 3. Semantic match check (if embedding service available)
+        mention_embedding = embedding
         if self.embedding_service:
             try:
-                # Generate embedding for the mention with context
-                text_to_embed = f"{mention} {entity_type}" if not context else f"{mention} {entity_type} {context[:100]}"
-                # encode() returns array of embeddings, take first one
-                embeddings = self.embedding_service.encode([text_to_embed])
-                mention_embedding = embeddings[0] if len(embeddings) > 0 else None
+                if mention_embedding is None:
+                    # Generate embedding for the mention with context
+                    text_to_embed = self._embedding_text(mention, entity_type, context)
+                    # encode() returns array of embeddings, take first one
+                    embeddings = self.embedding_service.encode([text_to_embed])
+                    mention_embedding = embeddings[0] if len(embeddings) > 0 else None
 
                 if mention_embedding is not None and len(mention_embedding) > 0:
                     # Search by embedding
@@ -284,8 +342,8 @@ class EntityResolutionService:
             except Exception as e:
                 logger.debug(f"Semantic matching failed: {e}")
 
-        # 4. No match found - create new entity
-        entity_id = await self._create_entity(mention, entity_type, context)
+        # 4. No match found - create new entity (reuse the mention embedding)
+        entity_id = await self._create_entity(mention, entity_type, context, embedding=mention_embedding)
         self._resolution_cache[cache_key] = entity_id
         logger.debug(f"New entity created: '{mention}' ({entity_type}) -> {entity_id[:8]}...")
 
@@ -295,7 +353,8 @@ class EntityResolutionService:
         self,
         canonical_name: str,
         entity_type: str,
-        context: str = ""
+        context: str = "",
+        embedding: Optional[Any] = None
     ) -> str:
         """Create a new entity in the database."""
         import uuid
@@ -304,12 +363,11 @@ class EntityResolutionService:
         entity_id = str(uuid.uuid4())
 
         # Generate embedding for the entity
-        text_to_embed = f"{canonical_name} {entity_type}"
-        if context:
-            text_to_embed += f" {context[:100]}"
+        text_to_embed = self._embedding_text(canonical_name, entity_type, context)
 
-        embedding = None
-        if self.embedding_service:
+        if embedding is not None and hasattr(embedding, 'tolist'):
+            embedding = embedding.tolist()
+        elif embedding is None and self.embedding_service:
             try:
                 # encode() returns array of embeddings, take first one
                 embeddings = self.embedding_service.encode([text_to_embed])
@@ -380,21 +438,31 @@ class EntityResolutionService:
     async def resolve_entities_batch(
         self,
         mentions: List[Tuple[str, str]],
-        context: str = ""
+        context: str = "",
+        contexts: Optional[List[str]] = None
     ) -> List[Tuple[str, bool]]:
         """
         Resolve multiple entity mentions in batch.
 
+        Embeddings are computed in one encode() call up front; resolution
+        itself stays sequential so later mentions can match entities created
+        by earlier ones.
+
         Args:
             mentions: List of (mention_text, entity_type) tuples
             context: Optional shared context
+            contexts: Optional per-mention contexts (overrides context)
 
         Returns:
             List of (entity_id, is_new) tuples
         """
+        if contexts is None:
+            contexts = [context] * len(mentions)
+        embeddings = self.precompute_embeddings(mentions, contexts)
+
         results = []
-        for mention, entity_type in mentions:
-            entity_id, is_new = await self.resolve_entity(mention, entity_type, context)
+        for (mention, entity_type), ctx, embedding in zip(mentions, contexts, embeddings):
+            entity_id, is_new = await self.resolve_entity(mention, entity_type, ctx, embedding=embedding)
             results.append((entity_id, is_new))
         return results
 
@@ -478,6 +546,30 @@ class EntityResolutionService:
             except Exception as e:
                 logger.warning(f"Failed to update entity relationships: {e}")
 
+    async def bulk_update_relationships(
+        self,
+        pair_map: Dict[Tuple[str, str], List[str]]
+    ):
+        """
+        Update co-occurrence relationships for many entity pairs at once.
+
+        Same result as calling update_entity_relationships for every
+        synthesis, but each entity is read and written once.
+
+        Args:
+            pair_map: (entity_id_a, entity_id_b) -> synthesis IDs where they co-occur
+        """
+        related: Dict[str, List[str]] = defaultdict(list)
+        for entity_a, entity_b in pair_map:
+            if entity_a == entity_b:
+                continue
+            related[entity_a].append(entity_b)
+            related[entity_b].append(entity_a)
+
+        if related:
+            # Sync Qdrant client: run off the event loop
+            await asyncio.to_thread(self.qdrant_service.bulk_update_entity_relationships, related)
+
     def clear_cache(self):
         """Clear the session resolution cache."""
         self._resolution_cache.clear()
@@ -4,22 +4,38 @@ Uses OpenAI Client to connect to OpenRouter API
 Includes retry logic with exponential backoff for resilience
 Circuit breaker pattern to prevent cascading failures
 """
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
+import hashlib
 import json
+import re
 import asyncio
 import random
+import time
 from loguru import logger
 from openai import AsyncOpenAI, APIError, APIConnectionError, RateLimitError, APITimeoutError
 
 from app.core.config import settings
 from app.core.circuit_breaker import get_circuit_breaker, CircuitOpenError
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # Retry configuration
 MAX_RETRIES = 3
 BASE_DELAY = 2.0
 MAX_DELAY = 30.0
 
+# generate_json cache: identical (prompt, temperature, max_tokens, model) requests
+# reuse the last valid JSON text instead of another API call. Only deterministic
+# calls (temperature 0) are cached unless the caller passes use_cache=True.
+JSON_CACHE_MAX_ENTRIES = 256
+JSON_CACHE_TTL_SECONDS = 3600.0
+
 
 def calculate_target_length(
     num_sources: int,
@@ -97,6 +113,26 @@ def calculate_target_length(
     return (min_words, max_words, max_tokens)
 
 
+# Outermost {...} span: second-chance parse for JSON wrapped in prose
+_JSON_BLOCK_RE = re.compile(r"\{.*\}", re.S)
+
+
+def _json_loads(text: str) -> Any:
+    """
+    Parse LLM JSON output, with orjson when installed.
+
+    orjson rejects a few inputs the stdlib accepts (NaN/Infinity, integers
+    beyond 64 bits); those are retried with json.loads so results don't
+    change. Both raise json.JSONDecodeError on invalid JSON.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
 class LLMService:
     """LLM Service via OpenRouter with circuit breaker"""
 
@@ -110,6 +146,7 @@ class LLMService:
         self.model = settings.OPENROUTER_MODEL
         self.circuit_breaker = get_circuit_breaker("openrouter")
         self._last_generation_cost = 0.0  # Track last generation cost
+        self._json_cache: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (stored_at, JSON text), LRU
 
     async def initialize(self):
         """Initialize OpenAI client for OpenRouter"""
@@ -158,6 +195,30 @@ class LLMService:
         """Get the cost of the last generation call"""
         return self._last_generation_cost
 
+    def _json_cache_key(self, prompt: str, temperature: float, max_tokens: int) -> str:
+        """Cache key for generate_json requests"""
+        raw = f"{self.model}|{temperature}|{max_tokens}|{prompt}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cached_json_text(self, key: str) -> Optional[str]:
+        """Cached JSON text for key, None if missing or older than the TTL"""
+        entry = self._json_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, text = entry
+        if time.monotonic() - stored_at > JSON_CACHE_TTL_SECONDS:
+            del self._json_cache[key]
+            return None
+        self._json_cache.move_to_end(key)
+        return text
+
+    def _cache_json_text(self, key: str, text: str) -> None:
+        """Remember a successfully parsed JSON response, evicting the oldest entries"""
+        self._json_cache[key] = (time.monotonic(), text)
+        self._json_cache.move_to_end(key)
+        while len(self._json_cache) > JSON_CACHE_MAX_ENTRIES:
+            self._json_cache.popitem(last=False)
+
     async def generate(self, prompt: str, temperature: float = 0.7, max_tokens: int = 2000) -> str:
         """
         Generate text completion with retry logic and circuit breaker
@@ -216,11 +277,19 @@ class LLMService:
         logger.error(f"LLM generation failed after {MAX_RETRIES} retries: {last_exception}")
         raise last_exception or Exception("Max retries exceeded")
 
-    async def generate_json(self, prompt: str, temperature: float = 0.3, max_tokens: int = 4000) -> Dict[str, Any]:
+    async def generate_json(
+        self,
+        prompt: str,
+        temperature: float = 0.3,
+        max_tokens: int = 4000,
+        use_cache: Optional[bool] = None,
+    ) -> Dict[str, Any]:
         """
         Generate JSON response with extended token limit for long-form content.
         Returns fallback structure on error instead of empty dict.
         Includes retry logic with exponential backoff and circuit breaker.
+        Responses are cached (JSON_CACHE_TTL_SECONDS) when use_cache is True,
+        or by default when temperature is 0; sampled output is never reused.
         """
         if not self.client:
             await self.initialize()
@@ -237,16 +306,30 @@ class LLMService:
             "predictions": []
         }
 
+        if use_cache is None:
+            use_cache = temperature == 0
+        cache_key = self._json_cache_key(prompt, temperature, max_tokens) if use_cache else None
+
+        # Identical request already answered: parse the cached text (fresh dict per call)
+        if cache_key is not None:
+            cached_text = self._cached_json_text(cache_key)
+            if cached_text is not None:
+                self._last_generation_cost = 0.0  # no API call made
+                logger.debug("generate_json cache hit")
+                return _json_loads(cached_text)
+
         # Check circuit breaker first
         try:
             return await self.circuit_breaker.call(
-                self._generate_json_with_retry, prompt, temperature, max_tokens
+                self._generate_json_with_retry, prompt, temperature, max_tokens, cache_key
             )
         except CircuitOpenError as e:
             logger.warning(f"Circuit breaker open: {e}")
             return fallback_response
 
-    async def _generate_json_with_retry(self, prompt: str, temperature: float, max_tokens: int) -> Dict[str, Any]:
+    async def _generate_json_with_retry(
+        self, prompt: str, temperature: float, max_tokens: int, cache_key: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Internal method with retry logic for JSON generation"""
         fallback_response = {
             "title": "Synthèse d'actualité",
@@ -304,7 +387,19 @@ class LLMService:
                 else:
                     logger.warning("⚠️ causal_chain MISSING from raw LLM output")
 
-                return json.loads(text)
+                try:
+                    parsed = _json_loads(text)
+                except json.JSONDecodeError:
+                    # Object embedded in prose ("Voici le JSON : {...}"): parse that span
+                    match = _JSON_BLOCK_RE.search(text)
+                    if not match:
+                        raise
+                    text = match.group(0)
+                    parsed = _json_loads(text)
+                    logger.info("Recovered JSON object embedded in LLM output")
+                if cache_key is not None:
+                    self._cache_json_text(cache_key, text)
+                return parsed
 
             except RateLimitError as e:
                 last_exception = e
@@ -94,7 +94,9 @@ class TopicDetectionService:
         if len(vectors) < min_syntheses:
             return []
 
-        vectors_array = np.array(vectors)
+        # Single contiguous float32 (N, D) matrix: HDBSCAN / cosine similarity
+        # run on it without an internal copy, at half the float64 footprint
+        vectors_array = np.ascontiguousarray(vectors, dtype=np.float32)
 
         # 3. Run HDBSCAN clustering
         try:
@@ -126,12 +128,15 @@ class TopicDetectionService:
             if label >= 0:  # Ignore noise (-1)
                 cluster_syntheses[label].append({
                     "synthesis": synthesis_data[i],
-                    "vector": vectors[i]
+                    "vector": vectors_array[i]
                 })
 
+        labels = np.asarray(labels)
         for cluster_id, items in cluster_syntheses.items():
             if len(items) >= min_syntheses:
-                topic = await self._create_or_update_topic(items)
+                # Centroid straight from the stored-vector matrix (no re-encoding)
+                centroid = vectors_array[labels == cluster_id].mean(axis=0)
+                topic = await self._create_or_update_topic(items, centroid=centroid)
                 if topic:
                     topics.append(topic)
 
@@ -172,13 +177,15 @@ class TopicDetectionService:
 
     async def _create_or_update_topic(
         self,
-        cluster_items: List[Dict]
+        cluster_items: List[Dict],
+        centroid: Optional[np.ndarray] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Create a new topic or update existing one for a cluster.
 
         Args:
             cluster_items: List of syntheses in this cluster
+            centroid: Precomputed cluster centroid (computed from items if None)
 
         Returns:
             Topic dictionary
@@ -192,8 +199,9 @@ class TopicDetectionService:
         categories = [item["synthesis"]["payload"].get("category", "MONDE") for item in cluster_items]
 
         # Calculate centroid embedding
-        vectors = [item["vector"] for item in cluster_items]
-        centroid = np.mean(vectors, axis=0)
+        if centroid is None:
+            vectors = [item["vector"] for item in cluster_items]
+            centroid = np.mean(vectors, axis=0)
 
         # Check if a similar topic already exists
         existing_topics = self.qdrant_service.search_topics_by_embedding(
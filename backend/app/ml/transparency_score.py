@@ -11,7 +11,9 @@ Breakdown:
 """
 
 import logging
-from typing import Any, Dict, List
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
@@ -58,6 +60,21 @@ DOMAIN_REGION_MAP: Dict[str, str] = {
 }
 
 
+# Score label thresholds: < 40 Faible, 40-59 Moyen, 60-79 Bon, >= 80 Excellent
+_LABEL_BINS = (40, 60, 80)
+_LABELS = ("Faible", "Moyen", "Bon", "Excellent")
+
+# Known domains, for set intersection with a synthesis' (deduplicated) domains
+_LANGUAGE_DOMAINS = frozenset(DOMAIN_LANGUAGE_MAP)
+_REGION_DOMAINS = frozenset(DOMAIN_REGION_MAP)
+
+
+@lru_cache(maxsize=2048)
+def _normalize_domain(domain: str) -> str:
+    """Bare lowercase domain (cached: a few hundred sources repeat across syntheses)."""
+    return domain.lower().replace("www.", "")
+
+
 class TransparencyScorer:
     """Calculates transparency scores for syntheses."""
 
@@ -78,11 +95,15 @@ class TransparencyScorer:
         Returns:
             Dict with score (0-100), breakdown, and label
         """
+        # Computed once, shared by the scores and the breakdown details
+        languages = self._get_languages(articles)
+        regions = self._get_regions(articles)
+
         source_score = self._source_diversity_score(synthesis, articles)
-        language_score = self._language_diversity_score(articles)
+        language_score = self._language_diversity_score(articles, languages)
         contradiction_score = self._contradiction_score(synthesis, rag_analysis)
         fact_score = self._fact_density_score(synthesis, rag_analysis)
-        geo_score = self._geo_coverage_score(articles)
+        geo_score = self._geo_coverage_score(articles, regions)
 
         total = (
             source_score * 0.30
@@ -95,14 +116,7 @@ class TransparencyScorer:
         score = round(total * 100)
         score = max(0, min(100, score))
 
-        if score >= 80:
-            label = "Excellent"
-        elif score >= 60:
-            label = "Bon"
-        elif score >= 40:
-            label = "Moyen"
-        else:
-            label = "Faible"
+        label = _LABELS[bisect_right(_LABEL_BINS, score)]
 
         return {
             "score": score,
@@ -116,7 +130,7 @@ class TransparencyScorer:
                 "language_diversity": {
                     "score": round(language_score * 100),
                     "weight": 20,
-                    "detail": f"{len(self._get_languages(articles))} langues",
+                    "detail": f"{len(languages)} langues",
                 },
                 "contradictions": {
                     "score": round(contradiction_score * 100),
@@ -131,7 +145,7 @@ class TransparencyScorer:
                 "geo_coverage": {
                     "score": round(geo_score * 100),
                     "weight": 15,
-                    "detail": f"{len(self._get_regions(articles))} regions",
+                    "detail": f"{len(regions)} regions",
                 },
             },
         }
@@ -167,20 +181,23 @@ class TransparencyScorer:
 
     def _get_languages(self, articles: List[Dict[str, Any]]) -> set:
         languages = set()
+        fallback_domains = set()
         for a in articles:
             lang = (a.get("language", "") or "").strip().lower()
             # Skip non-informative language values
             if lang and lang not in ("unknown", "und", "un", ""):
                 languages.add(lang[:2])
-                continue
-            # Fallback: detect from domain
-            domain = self._extract_domain(a)
-            if domain and domain in DOMAIN_LANGUAGE_MAP:
-                languages.add(DOMAIN_LANGUAGE_MAP[domain])
+            else:
+                fallback_domains.add(self._extract_domain(a))
+        # Fallback: detect from domain (each distinct domain looked up once)
+        languages.update(DOMAIN_LANGUAGE_MAP[d] for d in fallback_domains & _LANGUAGE_DOMAINS)
         return languages or {"fr"}
 
-    def _language_diversity_score(self, articles: List[Dict[str, Any]]) -> float:
-        langs = self._get_languages(articles)
+    def _language_diversity_score(
+        self, articles: List[Dict[str, Any]], langs: Optional[set] = None
+    ) -> float:
+        if langs is None:
+            langs = self._get_languages(articles)
         count = len(langs)
         if count >= 4:
             return 1.0
@@ -236,25 +253,22 @@ class TransparencyScorer:
         text = synthesis.get("summary", "") or synthesis.get("body", "")
         if not text:
             return 0.3
-        # Simple heuristic: count numbers, dates, quotes
-        fact_indicators = 0
-        for char in text:
-            if char.isdigit():
-                fact_indicators += 1
+        # Simple heuristic: count numbers, dates, quotes (digit count, C-level loop)
+        fact_indicators = sum(map(str.isdigit, text))
         # Normalize by text length
         density = min(1.0, fact_indicators / max(len(text) * 0.02, 1))
         return max(0.2, density)
 
     def _get_regions(self, articles: List[Dict[str, Any]]) -> set:
-        regions = set()
-        for a in articles:
-            domain = self._extract_domain(a)
-            if domain and domain in DOMAIN_REGION_MAP:
-                regions.add(DOMAIN_REGION_MAP[domain])
+        domains = {self._extract_domain(a) for a in articles}
+        regions = {DOMAIN_REGION_MAP[d] for d in domains & _REGION_DOMAINS}
         return regions or {"unknown"}
 
-    def _geo_coverage_score(self, articles: List[Dict[str, Any]]) -> float:
-        regions = self._get_regions(articles)
+    def _geo_coverage_score(
+        self, articles: List[Dict[str, Any]], regions: Optional[set] = None
+    ) -> float:
+        if regions is None:
+            regions = self._get_regions(articles)
         count = len(regions)
         if "unknown" in regions and count == 1:
             return 0.2
@@ -267,17 +281,17 @@ class TransparencyScorer:
         return 0.3
 
     def _extract_domain(self, article: Dict[str, Any]) -> str:
-        url = article.get("url", "") or article.get("source_url", "")
         domain = article.get("source_domain", "")
-        if domain:
-            return domain.lower().replace("www.", "")
-        if url:
+        if not domain:
+            # Article URLs are unique, so only the normalized netloc goes through the cache
+            url = article.get("url", "") or article.get("source_url", "")
+            if not url:
+                return ""
             try:
-                parsed = urlparse(url)
-                return parsed.netloc.lower().replace("www.", "")
+                domain = urlparse(url).netloc
             except (ValueError, AttributeError):
-                pass
-        return ""
+                return ""
+        return _normalize_domain(domain)
 
 
 # Singleton instance
@@ -1395,7 +1395,8 @@ class AdvancedNewsScraper:
             timeout=settings.REQUEST_TIMEOUT,
             follow_redirects=True
         )
-        self.robots_cache: Dict[str, RobotFileParser] = {}
+        # domain -> parser, or None when robots.txt could not be read (checked once per domain)
+        self.robots_cache: Dict[str, Optional[RobotFileParser]] = {}
         self.scraped_urls: Set[str] = set()
         self.article_hashes: Set[str] = set()
         self.last_request_time: Dict[str, datetime] = {}
@@ -1442,6 +1443,7 @@ class AdvancedNewsScraper:
                 self.robots_cache[domain] = rp
             except Exception as e:
                 logger.warning(f"Could not read robots.txt for {domain}: {e}")
+                self.robots_cache[domain] = None  # Ne pas re-tenter pour chaque URL du domaine
                 return True  # Si pas de robots.txt, on autorise
 
         rp = self.robots_cache.get(domain)
@@ -1518,8 +1520,9 @@ class AdvancedNewsScraper:
 
         base_url = source_config["url"]
 
-        # Vérifier robots.txt
-        if not self._check_robots_txt(source_domain, base_url):
+        # Vérifier robots.txt (lecture bloquante: hors de l'event loop pour que
+        # les découvertes parallèles ne s'attendent pas entre elles)
+        if not await asyncio.to_thread(self._check_robots_txt, source_domain, base_url):
             logger.warning(f"Scraping not allowed by robots.txt: {base_url}")
             return []
 
@@ -2041,12 +2044,24 @@ class AdvancedNewsScraper:
 
         all_articles = []
 
-        # Phase 1: Découverte des URLs (séquentiel par source)
+        # Phase 1: Découverte des URLs (sources en parallèle, une requête par hôte)
         logger.info(f"🔍 Discovering articles from {len(sources)} sources...")
         all_urls = []
+        discovery_semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS)
+
+        async def discover_with_semaphore(source_domain):
+            async with discovery_semaphore:
+                return await self.discover_article_urls(source_domain, max_articles_per_source)
+
+        discovered = await asyncio.gather(
+            *(discover_with_semaphore(source_domain) for source_domain in sources),
+            return_exceptions=True
+        )
 
-        for source_domain in sources:
-            urls = await self.discover_article_urls(source_domain, max_articles_per_source)
+        for source_domain, urls in zip(sources, discovered):
+            if isinstance(urls, Exception):
+                logger.warning(f"URL discovery failed for {source_domain}: {urls}")
+                continue
             all_urls.extend(urls)
 
         logger.info(f"📰 Found {len(all_urls)} article URLs")
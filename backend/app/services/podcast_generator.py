@@ -249,7 +249,7 @@ class PodcastGenerator:
     def _cache_key(syntheses: List[Dict], duration: int) -> str:
         ids = "|".join(str(s.get("id", s.get("title", "")[:20])) for s in syntheses[:4])
         content = f"{ids}:{duration}"
-        return hashlib.md5(content.encode()).hexdigest()
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
 
 
 # Global instance
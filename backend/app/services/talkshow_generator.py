@@ -1263,7 +1263,7 @@ Speakers valides UNIQUEMENT: {speakers_str}"""
             str(s.get("id", s.get("title", "")[:20])) for s in syntheses[:6]
         )
         content = f"talkshow:{topic}:{ids}:{duration}"
-        return hashlib.md5(content.encode()).hexdigest()
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
 
 
 def _normalize_lufs(audio_seg, target_lufs: float = -16.0):
@@ -6,6 +6,7 @@ Selection via TTS_PROVIDER env var or auto-detection.
 
 import hashlib
 import re
+import textwrap
 from typing import Optional, Dict, Any
 from pathlib import Path
 from loguru import logger
@@ -47,7 +48,7 @@ _strip_audio_tags = _preprocess_text
 
 def _hash(text: str, voice: str, prefix: str = "") -> str:
     content = f"{prefix}:{text}:{voice}"
-    return hashlib.md5(content.encode()).hexdigest()
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
 
 
 def _get_cache(text_hash: str) -> Optional[bytes]:
@@ -1320,12 +1321,13 @@ def _build_synthesis_script(synthesis: Dict[str, Any]) -> Optional[str]:
     if title:
         parts.append(title + ".")
     if summary:
-        parts.append(summary[:500])
+        # Cut on a word boundary so TTS never reads a truncated word
+        parts.append(textwrap.shorten(summary, width=500, placeholder="…"))
     if key_points and isinstance(key_points, list):
         parts.append("Points cles:")
         for i, p in enumerate(key_points[:5], 1):
             if isinstance(p, str):
-                parts.append(f"{i}. {p}")
+                parts.append(f"{i}. {textwrap.shorten(p, width=200, placeholder='…')}")
     return " ".join(parts) if parts else None
 
 
@@ -2,7 +2,9 @@
 """
 Backup & Restore Syntheses - NovaPress AI
 ==========================================
-Sauvegarde et restaure les synthèses depuis/vers Qdrant en fichiers JSON.
+Sauvegarde et restaure les synthèses depuis/vers Qdrant en fichiers NDJSON
+(un point par ligne, écrit en streaming). Les anciens backups JSON restent
+restaurables.
 
 Usage:
     python scripts/backup_syntheses.py backup              # Sauvegarde toutes les synthèses
@@ -23,8 +25,8 @@ from pathlib import Path
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import requests
-from typing import List, Dict, Any, Optional
+import httpx
+from typing import List, Dict, Any, Iterator, Optional, TextIO
 # uuid removed - not needed
 
 
@@ -33,27 +35,41 @@ QDRANT_URL = os.getenv("QDRANT_URL", "http://localhost:6333")
 COLLECTION_NAME = os.getenv("QDRANT_COLLECTION", "novapress_articles")
 SYNTHESES_COLLECTION = "novapress_syntheses"  # Separate collection for syntheses
 BACKUP_DIR = Path(__file__).parent.parent / "data" / "backups"
+BACKUP_SUFFIX = ".jsonl"  # NDJSON: une ligne par point
+BACKUP_VERSION = "2.0"
+SCROLL_BATCH_SIZE = 100
+
+# Client partagé: une seule connexion keep-alive vers Qdrant pour tous les
+# scrolls et upserts (au lieu d'une connexion TCP par page)
+_client = httpx.Client(
+    base_url=QDRANT_URL,
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+)
 
 # Ensure backup directory exists
 BACKUP_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def get_all_syntheses() -> List[Dict[str, Any]]:
-    """Récupère toutes les synthèses depuis Qdrant (collection novapress_syntheses)."""
-    syntheses = []
+def iter_points(collection: str) -> Iterator[Dict[str, Any]]:
+    """
+    Parcourt une collection Qdrant page par page (scroll) et yield chaque point.
+
+    Seule la page courante est gardée en mémoire, pas la collection entière.
+    """
     offset = None
 
     while True:
         payload = {
-            "limit": 100,
+            "limit": SCROLL_BATCH_SIZE,
             "with_payload": True,
             "with_vector": True,
         }
         if offset:
             payload["offset"] = offset
 
-        response = requests.post(
-            f"{QDRANT_URL}/collections/{SYNTHESES_COLLECTION}/points/scroll",
+        response = _client.post(
+            f"/collections/{collection}/points/scroll",
             json=payload
         )
 
@@ -65,62 +81,45 @@ def get_all_syntheses() -> List[Dict[str, Any]]:
         points = data.get("result", {}).get("points", [])
 
         for point in points:
-            syntheses.append({
+            yield {
                 "id": point["id"],
                 "payload": point["payload"],
                 "vector": point.get("vector", [])
-            })
+            }
 
         offset = data.get("result", {}).get("next_page_offset")
         if not offset or not points:
             break
 
-    return syntheses
+
+def get_all_syntheses() -> List[Dict[str, Any]]:
+    """Récupère toutes les synthèses depuis Qdrant (collection novapress_syntheses)."""
+    return list(iter_points(SYNTHESES_COLLECTION))
 
 
 def get_all_articles() -> List[Dict[str, Any]]:
     """Récupère tous les articles depuis Qdrant (pour backup complet)."""
-    articles = []
-    offset = None
-
-    while True:
-        payload = {
-            "limit": 100,
-            "with_payload": True,
-            "with_vector": True,
-        }
-        if offset:
-            payload["offset"] = offset
-
-        response = requests.post(
-            f"{QDRANT_URL}/collections/{COLLECTION_NAME}/points/scroll",
-            json=payload
-        )
+    return list(iter_points(COLLECTION_NAME))
 
-        if response.status_code != 200:
-            print(f"Erreur Qdrant: {response.status_code}")
-            break
 
-        data = response.json()
-        points = data.get("result", {}).get("points", [])
-
-        for point in points:
-            articles.append({
-                "id": point["id"],
-                "payload": point["payload"],
-                "vector": point.get("vector", [])
-            })
-
-        offset = data.get("result", {}).get("next_page_offset")
-        if not offset or not points:
-            break
-
-    return articles
+def _write_line(out: TextIO, record: Dict[str, Any]) -> None:
+    """Écrit un enregistrement NDJSON (une ligne JSON compacte)."""
+    out.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+    out.write("\n")
 
 
 def backup_syntheses(name: Optional[str] = None, include_articles: bool = False) -> str:
     """
-    Sauvegarde les synthèses en JSON.
+    Sauvegarde les synthèses en NDJSON (un point par ligne).
+
+    Les points sont écrits au fil du scroll Qdrant : la mémoire utilisée est
+    celle d'une page, pas celle de toute la collection.
+
+    Format:
+        {"type": "metadata", ...}                      # première ligne
+        {"type": "synthesis", "id", "payload", "vector"}
+        {"type": "article", "id", "payload", "vector"}  # si include_articles
+        {"type": "summary", "syntheses_count", ...}   # dernière ligne
 
     Args:
         name: Nom personnalisé pour le backup
@@ -132,48 +131,94 @@ def backup_syntheses(name: Optional[str] = None, include_articles: bool = False)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     if name:
-        filename = f"syntheses_{name}_{timestamp}.json"
+        filename = f"syntheses_{name}_{timestamp}{BACKUP_SUFFIX}"
     else:
-        filename = f"syntheses_{timestamp}.json"
+        filename = f"syntheses_{timestamp}{BACKUP_SUFFIX}"
+
+    if include_articles:
+        filename = filename.replace("syntheses_", "full_backup_")
 
     filepath = BACKUP_DIR / filename
 
-    print(f"[...] Récupération des synthèses depuis Qdrant...")
-    syntheses = get_all_syntheses()
-
-    backup_data = {
-        "metadata": {
-            "created_at": datetime.now().isoformat(),
-            "qdrant_url": QDRANT_URL,
-            "collection": COLLECTION_NAME,
-            "syntheses_count": len(syntheses),
-            "version": "1.0"
-        },
-        "syntheses": syntheses
+    metadata = {
+        "type": "metadata",
+        "created_at": datetime.now().isoformat(),
+        "qdrant_url": QDRANT_URL,
+        "collection": COLLECTION_NAME,
+        "version": BACKUP_VERSION
     }
+    summary = {"type": "summary", "syntheses_count": 0}
 
-    if include_articles:
-        print(f"[...] Récupération des articles...")
-        articles = get_all_articles()
-        backup_data["articles"] = articles
-        backup_data["metadata"]["articles_count"] = len(articles)
-        filename = filename.replace("syntheses_", "full_backup_")
-        filepath = BACKUP_DIR / filename
+    with open(filepath, 'w', encoding='utf-8') as out:
+        _write_line(out, metadata)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(backup_data, f, ensure_ascii=False, indent=2)
+        print(f"[...] Récupération des synthèses depuis Qdrant...")
+        for point in iter_points(SYNTHESES_COLLECTION):
+            _write_line(out, {"type": "synthesis", **point})
+            summary["syntheses_count"] += 1
+
+        if include_articles:
+            print(f"[...] Récupération des articles...")
+            summary["articles_count"] = 0
+            for point in iter_points(COLLECTION_NAME):
+                _write_line(out, {"type": "article", **point})
+                summary["articles_count"] += 1
+
+        _write_line(out, summary)
 
     print(f"[OK] Backup créé: {filepath}")
-    print(f"   - {len(syntheses)} synthèses sauvegardées")
+    print(f"   - {summary['syntheses_count']} synthèses sauvegardées")
     if include_articles:
-        print(f"   - {len(articles)} articles sauvegardés")
+        print(f"   - {summary['articles_count']} articles sauvegardés")
 
     return str(filepath)
 
 
+def _iter_backup_records(backup_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Lit un backup et yield les points sous la forme {"type", "id", "payload", "vector"}.
+
+    Supporte le format NDJSON (.jsonl, lu ligne par ligne) et l'ancien format
+    JSON monolithique (.json, v1.0) pour les backups existants.
+    """
+    if backup_path.suffix == BACKUP_SUFFIX:
+        with open(backup_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get("type") in ("synthesis", "article"):
+                    yield record
+        return
+
+    with open(backup_path, 'r', encoding='utf-8') as f:
+        backup_data = json.load(f)
+
+    for s in backup_data.get("syntheses", []):
+        yield {"type": "synthesis", **s}
+    for a in backup_data.get("articles", []):
+        yield {"type": "article", **a}
+
+
+def _upsert_batch(batch: List[Dict[str, Any]]) -> int:
+    """Upsert un batch de points dans Qdrant. Retourne le nombre de points écrits."""
+    response = _client.put(
+        f"/collections/{COLLECTION_NAME}/points",
+        json={"points": batch},
+        params={"wait": "true"}
+    )
+    if response.status_code == 200:
+        return len(batch)
+    print(f"[WARN] Erreur batch: {response.text}")
+    return 0
+
+
 def restore_syntheses(filepath: Optional[str] = None) -> int:
     """
-    Restaure les synthèses depuis un backup JSON.
+    Restaure les synthèses depuis un backup (NDJSON ou ancien JSON).
+
+    Les points sont relus en une seule passe et upsertés par batch de 100,
+    le pic mémoire est donc d'un batch et non du backup complet.
 
     Args:
         filepath: Chemin du fichier backup (ou None pour le dernier)
@@ -185,7 +230,7 @@ def restore_syntheses(filepath: Optional[str] = None) -> int:
 
     if filepath is None:
         # Trouver le dernier backup
-        backups = list(BACKUP_DIR.glob("*.json"))
+        backups = _list_backup_files()
         if not backups:
             print("[ERROR] Aucun backup trouvé!")
             return 0
@@ -201,78 +246,64 @@ def restore_syntheses(filepath: Optional[str] = None) -> int:
 
     print(f"[...] Chargement du backup: {backup_path}")
 
-    with open(backup_path, 'r', encoding='utf-8') as f:
-        backup_data = json.load(f)
+    restored = 0
+    counts = {"synthesis": 0, "article": 0}
+    batch: List[Dict[str, Any]] = []
+
+    print(f"[...] Restauration des points...")
+    for record in _iter_backup_records(backup_path):
+        point = {
+            "id": record["id"],
+            "payload": record["payload"],
+        }
+        if record.get("vector"):
+            point["vector"] = record["vector"]
+        batch.append(point)
+        counts[record["type"]] += 1
+
+        # Upsert par batch de 100
+        if len(batch) >= SCROLL_BATCH_SIZE:
+            restored += _upsert_batch(batch)
+            batch = []
 
-    syntheses = backup_data.get("syntheses", [])
-    articles = backup_data.get("articles", []) if "articles" in backup_data else []
+    if batch:
+        restored += _upsert_batch(batch)
 
-    if not syntheses and not articles:
+    if not counts["synthesis"] and not counts["article"]:
         print("[ERROR] Aucune donnée à restaurer!")
         return 0
 
     print(f"[BACKUP] Donnees trouvees:")
-    print(f"   - {len(syntheses)} synthèses")
-    print(f"   - {len(articles)} articles")
+    print(f"   - {counts['synthesis']} synthèses")
+    print(f"   - {counts['article']} articles")
 
-    # Restaurer les synthèses
-    restored = 0
+    print(f"[OK] Restauration terminée: {restored} points restaurés")
+    return restored
 
-    if syntheses:
-        print(f"[...] Restauration des synthèses...")
-        points = []
-        for s in syntheses:
-            point = {
-                "id": s["id"],
-                "payload": s["payload"],
-            }
-            if s.get("vector"):
-                point["vector"] = s["vector"]
-            points.append(point)
 
-        # Upsert par batch de 100
-        for i in range(0, len(points), 100):
-            batch = points[i:i+100]
-            response = requests.put(
-                f"{QDRANT_URL}/collections/{COLLECTION_NAME}/points",
-                json={"points": batch},
-                params={"wait": "true"}
-            )
-            if response.status_code == 200:
-                restored += len(batch)
-            else:
-                print(f"[WARN] Erreur batch {i}: {response.text}")
-
-    # Restaurer les articles si présents
-    if articles:
-        print(f"[...] Restauration des articles...")
-        points = []
-        for a in articles:
-            point = {
-                "id": a["id"],
-                "payload": a["payload"],
-            }
-            if a.get("vector"):
-                point["vector"] = a["vector"]
-            points.append(point)
-
-        for i in range(0, len(points), 100):
-            batch = points[i:i+100]
-            response = requests.put(
-                f"{QDRANT_URL}/collections/{COLLECTION_NAME}/points",
-                json={"points": batch},
-                params={"wait": "true"}
-            )
-            if response.status_code == 200:
-                restored += len(batch)
+def _list_backup_files() -> List[Path]:
+    """Retourne tous les fichiers de backup (NDJSON et ancien JSON)."""
+    return list(BACKUP_DIR.glob(f"*{BACKUP_SUFFIX}")) + list(BACKUP_DIR.glob("*.json"))
 
-    print(f"[OK] Restauration terminée: {restored} points restaurés")
-    return restored
+
+def _read_backup_count(backup: Path) -> Any:
+    """Lit le nombre de synthèses d'un backup sans charger tous les points."""
+    if backup.suffix == BACKUP_SUFFIX:
+        # La ligne "summary" est la dernière: lire uniquement la fin du fichier
+        with open(backup, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 4096))
+            last_line = f.read().rstrip(b"\n").rsplit(b"\n", 1)[-1]
+        return json.loads(last_line).get("syntheses_count", "?")
+
+    with open(backup, 'r') as f:
+        data = json.load(f)
+        return data.get("metadata", {}).get("syntheses_count", "?")
 
 
 def list_backups():
     """Liste tous les backups disponibles."""
-    backups = list(BACKUP_DIR.glob("*.json"))
+    backups = _list_backup_files()
 
     if not backups:
         print("[DIR] Aucun backup trouve dans:", BACKUP_DIR)
@@ -295,11 +326,8 @@ def list_backups():
 
         # Load metadata
         try:
-            with open(backup, 'r') as f:
-                data = json.load(f)
-                meta = data.get("metadata", {})
-                count = meta.get("syntheses_count", "?")
-                print(f"{backup.name:<50} {size_str:<12} {mtime.strftime('%Y-%m-%d %H:%M')} ({count} synthèses)")
+            count = _read_backup_count(backup)
+            print(f"{backup.name:<50} {size_str:<12} {mtime.strftime('%Y-%m-%d %H:%M')} ({count} synthèses)")
         except:
             print(f"{backup.name:<50} {size_str:<12} {mtime.strftime('%Y-%m-%d %H:%M')}")
 
@@ -307,7 +335,10 @@ def list_backups():
 def auto_backup():
     """Backup automatique appelé par le pipeline."""
     # Garde les 10 derniers backups auto
-    auto_backups = list(BACKUP_DIR.glob("syntheses_auto_*.json"))
+    auto_backups = [
+        p for p in _list_backup_files()
+        if p.name.startswith(("syntheses_auto_", "full_backup_auto_"))
+    ]
     if len(auto_backups) > 10:
         oldest = sorted(auto_backups, key=lambda p: p.stat().st_mtime)[:len(auto_backups)-10]
         for f in oldest:
@@ -353,6 +384,7 @@ Exemples:
     elif args.action == "auto":
         auto_backup()
 
+    _client.close()
     print()
 
 
@@ -14,14 +14,23 @@ Options:
     --dry-run       Show what would be done without making changes
     --force         Force re-migration even if data exists
     --batch-size    Number of syntheses to process at once (default: 50)
+    --no-cache      Discard the on-disk entity resolution cache before running
 """
 
 import asyncio
 import sys
 import argparse
-from datetime import datetime
-from typing import List, Dict, Any
+import hashlib
+import itertools
+import shelve
+import time
+import unicodedata
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Dict, Any, AsyncIterator, Optional, Set, Tuple
 from loguru import logger
+from qdrant_client.models import Filter, FieldCondition, Range
 
 # Add parent directory to path for imports
 sys.path.insert(0, '.')
@@ -30,23 +39,63 @@ from app.db.qdrant_client import get_qdrant_service, init_qdrant
 from app.ml.entity_resolution import get_entity_resolution_service, init_entity_resolution
 from app.ml.topic_detection import get_topic_detection_service, init_topic_detection
 from app.ml.causal_aggregator import get_causal_aggregator
-from app.ml.embeddings import get_embedding_service
+from app.ml.embeddings import get_embedding_service, init_embedding_model
 from app.core.config import settings
+from app.core.event_loop import install_fast_event_loop
+
+# Only migrate syntheses created within this window
+SYNTHESES_LOOKBACK_DAYS = 365
+
+# Max aggregated causal graphs memoized per run
+AGGREGATION_CACHE_SIZE = 1024
+
+# Resolved (type, mention) -> entity_id, persisted across runs
+ENTITY_CACHE_PATH = Path("data/cache/entity_resolution")
+ENTITY_CACHE_TTL_SECONDS = 30 * 86400
+
+
+def _normalize_mention(name: str) -> str:
+    """Collapse case/width/whitespace variants ("Stanford", "  STANFORD ") of a mention."""
+    return unicodedata.normalize("NFKC", name).strip().casefold()
+
+
+def _synthesis_set_hash(synthesis_ids: List[str]) -> str:
+    """Order-independent hash of a synthesis id set."""
+    return hashlib.blake2b(",".join(sorted(synthesis_ids)).encode(), digest_size=16).hexdigest()
+
+
+def _mention_digest(key: Tuple[str, str]) -> str:
+    """Stable on-disk cache key for a (TYPE, normalized mention) pair."""
+    return hashlib.blake2b(f"{key[0]}|{key[1]}".encode("utf-8"), digest_size=16).hexdigest()
 
 
 class IntelligenceMigration:
     """Migrates existing data to Intelligence Hub structure."""
 
-    def __init__(self, dry_run: bool = False, force: bool = False, batch_size: int = 50):
+    def __init__(
+        self,
+        dry_run: bool = False,
+        force: bool = False,
+        batch_size: int = 50,
+        use_cache: bool = True
+    ):
         self.dry_run = dry_run
         self.force = force
         self.batch_size = batch_size
+        self.use_cache = use_cache
         self.qdrant = None
         self.entity_resolver = None
         self.topic_detector = None
         self.causal_aggregator = None
         self.embedding_service = None
 
+        # (TYPE, normalized mention) -> entity_id, shared by all batches of the run
+        self._mention_cache: Dict[Tuple[str, str], str] = {}
+        # blake2b(sorted synthesis ids) -> aggregated causal graph
+        self._aggregation_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Same mapping persisted on disk, so --force re-runs skip re-resolution
+        self._disk_cache: Optional[shelve.Shelf] = None
+
         # Stats
         self.stats = {
             "syntheses_processed": 0,
@@ -55,6 +104,7 @@ class IntelligenceMigration:
             "topics_created": 0,
             "topics_updated": 0,
             "causal_graphs_aggregated": 0,
+            "causal_graphs_unchanged": 0,
             "errors": 0
         }
 
@@ -68,6 +118,7 @@ class IntelligenceMigration:
         logger.success("Qdrant initialized")
 
         # Initialize embedding service
+        await init_embedding_model()
         self.embedding_service = get_embedding_service()
         logger.success("Embedding service initialized")
 
@@ -85,102 +136,274 @@ class IntelligenceMigration:
         self.causal_aggregator = get_causal_aggregator()
         logger.success("Causal Aggregator initialized")
 
-    async def check_existing_data(self) -> Dict[str, int]:
-        """Check if data already exists in collections."""
+        # Open the entity resolution cache ("n" starts from an empty file)
+        if not self.dry_run:
+            ENTITY_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            self._disk_cache = shelve.open(
+                str(ENTITY_CACHE_PATH), flag="c" if self.use_cache else "n"
+            )
+            logger.info(f"Entity resolution cache: {len(self._disk_cache)} entries")
+
+    def close(self) -> None:
+        """Flush and close the on-disk entity resolution cache."""
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+
+    def _cached_entity_id(self, key: Tuple[str, str]) -> Optional[str]:
+        """Look up a resolved entity id in the disk cache, ignoring expired entries."""
+        if self._disk_cache is None:
+            return None
+        entry = self._disk_cache.get(_mention_digest(key))
+        if not entry:
+            return None
+        entity_id, stored_at = entry
+        if time.time() - stored_at > ENTITY_CACHE_TTL_SECONDS:
+            return None
+        return entity_id
+
+    def _cache_entity_id(self, key: Tuple[str, str], entity_id: str) -> None:
+        """Persist a resolved entity id in the disk cache."""
+        if self._disk_cache is not None:
+            self._disk_cache[_mention_digest(key)] = (entity_id, time.time())
+
+    def _existing_entity_ids(self, entity_ids: List[str]) -> Set[str]:
+        """Return the subset of entity_ids still present in the entities collection."""
         try:
-            entities_count = self.qdrant.client.count(
-                collection_name=self.qdrant.entities_collection
-            ).count
-        except Exception:
-            entities_count = 0
+            points = self.qdrant.client.retrieve(
+                collection_name=self.qdrant.entities_collection,
+                ids=entity_ids,
+                with_payload=False,
+                with_vectors=False
+            )
+        except Exception as e:
+            logger.debug(f"Failed to check cached entities: {e}")
+            return set()
+        return {str(point.id) for point in points}
 
-        try:
-            topics_count = self.qdrant.client.count(
+    async def check_existing_data(self) -> Dict[str, int]:
+        """Check if data already exists in collections (both counts run concurrently)."""
+        entities, topics = await asyncio.gather(
+            asyncio.to_thread(
+                self.qdrant.client.count,
+                collection_name=self.qdrant.entities_collection
+            ),
+            asyncio.to_thread(
+                self.qdrant.client.count,
                 collection_name=self.qdrant.topics_collection
-            ).count
-        except Exception:
-            topics_count = 0
+            ),
+            return_exceptions=True
+        )
 
+        # A failed count (e.g. missing collection) comes back as an exception -> 0
         return {
-            "entities": entities_count,
-            "topics": topics_count
+            "entities": getattr(entities, "count", 0),
+            "topics": getattr(topics, "count", 0)
         }
 
+    async def iter_syntheses(self, batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield syntheses from the last year, one Qdrant scroll page at a time.
+
+        Only the current page is held in memory, and processing of a page can
+        start before the rest of the collection has been fetched.
+        """
+        cutoff_time = (datetime.now() - timedelta(days=SYNTHESES_LOOKBACK_DAYS)).timestamp()
+        scroll_filter = Filter(
+            must=[FieldCondition(key="created_at", range=Range(gte=cutoff_time))]
+        )
+        offset = None
+
+        while True:
+            try:
+                points, offset = await asyncio.to_thread(
+                    self.qdrant.client.scroll,
+                    collection_name=self.qdrant.syntheses_collection,
+                    scroll_filter=scroll_filter,
+                    limit=batch_size,
+                    offset=offset,
+                    with_payload=True,
+                    with_vectors=False
+                )
+            except Exception as e:
+                logger.error(f"Failed to fetch syntheses: {e}")
+                self.stats["errors"] += 1
+                return
+
+            if points:
+                yield [{**point.payload, "id": point.id} for point in points]
+
+            if offset is None or not points:
+                return
+
+    @staticmethod
+    def _parse_entity(entity: Any) -> Tuple[str, str]:
+        """Extract (name, type) from the different key_entities formats."""
+        if isinstance(entity, dict):
+            return entity.get("name", ""), entity.get("type", "UNKNOWN")
+        if isinstance(entity, (tuple, list)) and len(entity) >= 2:
+            return entity[0], entity[1]
+        return str(entity), "UNKNOWN"
+
+    async def migrate_all_entities(self) -> int:
+        """Stream all syntheses page by page into migrate_entities. Returns the count."""
+        syntheses_found = 0
+        async for batch in self.iter_syntheses(self.batch_size):
+            syntheses_found += len(batch)
+            await self.migrate_entities(batch)
+        return syntheses_found
+
     async def migrate_entities(self, syntheses: List[Dict[str, Any]]) -> None:
-        """Migrate entities from existing syntheses."""
+        """Migrate entities from existing syntheses, batch_size syntheses at a time."""
         logger.info(f"Migrating entities from {len(syntheses)} syntheses...")
 
-        for synthesis in syntheses:
-            try:
-                key_entities = synthesis.get("key_entities", [])
-                synthesis_id = synthesis.get("id", "")
-                title = synthesis.get("title", "")
+        for start in range(0, len(syntheses), self.batch_size):
+            await self._migrate_entities_batch(syntheses[start:start + self.batch_size])
+
+    async def _migrate_entities_batch(self, syntheses: List[Dict[str, Any]]) -> None:
+        """
+        Resolve the entities of a batch of syntheses.
+
+        All mentions of the batch are collected first so their embeddings are
+        computed in a single encode() call, then resolved in order.
+        """
+        # First pass: collect unique (mention, type) + context for the whole batch.
+        # Mentions already resolved in this run are answered from the cache,
+        # mentions resolved by a previous run from the disk cache.
+        resolved_ids: List[List[str]] = [[] for _ in syntheses]
+        mentions: List[Tuple[str, str]] = []
+        contexts: List[str] = []
+        owners: List[List[int]] = []  # indexes of the syntheses using each mention
+        keys: List[Tuple[str, str]] = []
+        pending: Dict[Tuple[str, str], int] = {}
+        # key -> (cached entity_id, name, type, context, owners)
+        disk_hits: Dict[Tuple[str, str], Tuple[str, str, str, str, List[int]]] = {}
+
+        for index, synthesis in enumerate(syntheses):
+            title = synthesis.get("title", "")
+            key_entities = synthesis.get("key_entities", []) or []
+            if isinstance(key_entities, str):
+                # Stored as a comma-separated string in the syntheses payload
+                key_entities = [e.strip() for e in key_entities.split(",")]
+
+            for entity in key_entities:
+                entity_name, entity_type = self._parse_entity(entity)
+
+                if not entity_name or len(entity_name) < 2:
+                    continue
 
-                if not key_entities:
+                if self.dry_run:
+                    logger.debug(f"[DRY RUN] Would resolve entity: {entity_name} ({entity_type})")
                     continue
 
-                resolved_ids = []
-                for entity in key_entities:
-                    # Handle different entity formats
-                    if isinstance(entity, dict):
-                        entity_name = entity.get("name", "")
-                        entity_type = entity.get("type", "UNKNOWN")
-                    elif isinstance(entity, (tuple, list)) and len(entity) >= 2:
-                        entity_name, entity_type = entity[0], entity[1]
-                    else:
-                        entity_name = str(entity)
-                        entity_type = "UNKNOWN"
-
-                    if not entity_name or len(entity_name) < 2:
-                        continue
-
-                    if self.dry_run:
-                        logger.debug(f"[DRY RUN] Would resolve entity: {entity_name} ({entity_type})")
-                        continue
-
-                    try:
-                        entity_id, is_new = await self.entity_resolver.resolve_entity(
-                            mention=entity_name,
-                            entity_type=entity_type.upper(),
-                            context=title
-                        )
-                        resolved_ids.append(entity_id)
-
-                        if is_new:
-                            self.stats["entities_created"] += 1
-                        else:
-                            self.stats["entities_resolved"] += 1
-
-                    except Exception as e:
-                        logger.warning(f"Failed to resolve entity '{entity_name}': {e}")
-                        self.stats["errors"] += 1
-
-                # Update entity mentions
-                if resolved_ids and not self.dry_run:
-                    for entity_id in resolved_ids:
-                        try:
-                            self.qdrant.update_entity_mentions(entity_id, synthesis_id)
-                        except Exception as e:
-                            logger.debug(f"Failed to update mentions for {entity_id}: {e}")
-
-                    # Update relationships
-                    if len(resolved_ids) >= 2:
-                        try:
-                            await self.entity_resolver.update_entity_relationships(
-                                entity_ids=resolved_ids,
-                                synthesis_id=synthesis_id
-                            )
-                        except Exception as e:
-                            logger.debug(f"Failed to update relationships: {e}")
+                key = (entity_type.upper(), _normalize_mention(entity_name))
+                if key in self._mention_cache:
+                    resolved_ids[index].append(self._mention_cache[key])
+                    self.stats["entities_resolved"] += 1
+                elif key in pending:
+                    owners[pending[key]].append(index)
+                elif key in disk_hits:
+                    disk_hits[key][4].append(index)
+                elif (cached_id := self._cached_entity_id(key)) is not None:
+                    disk_hits[key] = (cached_id, entity_name, entity_type.upper(), title, [index])
+                else:
+                    pending[key] = len(mentions)
+                    mentions.append((entity_name, entity_type.upper()))
+                    contexts.append(title)
+                    owners.append([index])
+                    keys.append(key)
+
+        # Disk cache hits are only trusted if the entity still exists (one retrieve
+        # for the batch); stale ones are resolved again like any other mention.
+        if disk_hits:
+            live_ids = await asyncio.to_thread(
+                self._existing_entity_ids, [hit[0] for hit in disk_hits.values()]
+            )
+            for key, (entity_id, entity_name, entity_type, title, hit_owners) in disk_hits.items():
+                if entity_id in live_ids:
+                    self._mention_cache[key] = entity_id
+                    for index in hit_owners:
+                        resolved_ids[index].append(entity_id)
+                    self.stats["entities_resolved"] += len(hit_owners)
+                else:
+                    mentions.append((entity_name, entity_type))
+                    contexts.append(title)
+                    owners.append(hit_owners)
+                    keys.append(key)
+
+        embeddings = self.entity_resolver.precompute_embeddings(mentions, contexts)
+
+        # Second pass: resolve each unique mention once with its precomputed embedding
+        mention_map: Dict[str, List[str]] = defaultdict(list)
+        for (entity_name, entity_type), context, embedding, mention_owners, key in zip(
+            mentions, contexts, embeddings, owners, keys
+        ):
+            try:
+                entity_id, is_new = await self.entity_resolver.resolve_entity(
+                    mention=entity_name,
+                    entity_type=entity_type,
+                    context=context,
+                    embedding=embedding
+                )
+                self._mention_cache[key] = entity_id
+                self._cache_entity_id(key, entity_id)
+                for index in mention_owners:
+                    resolved_ids[index].append(entity_id)
+
+                if is_new:
+                    self.stats["entities_created"] += 1
+                    self.stats["entities_resolved"] += len(mention_owners) - 1
+                else:
+                    self.stats["entities_resolved"] += len(mention_owners)
+
+            except Exception as e:
+                logger.warning(f"Failed to resolve entity '{entity_name}': {e}")
+                self.stats["errors"] += 1
+
+        # Collect mentions and co-occurring entity pairs for the whole batch
+        pair_map: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        for synthesis, synthesis_entity_ids in zip(syntheses, resolved_ids):
+            self._collect_synthesis(synthesis, synthesis_entity_ids, mention_map, pair_map)
+
+        # One set_payload batch for every entity mentioned in this batch, and one
+        # write per unique entity pair set instead of one per (pair, synthesis).
+        # Both touch different payload keys, so they run concurrently off the loop.
+        writes = []
+        if mention_map:
+            writes.append(asyncio.to_thread(self.qdrant.bulk_update_entity_mentions, mention_map))
+        if pair_map:
+            writes.append(self.entity_resolver.bulk_update_relationships(pair_map))
+
+        for result in await asyncio.gather(*writes, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.debug(f"Failed to update entity mentions/relationships: {result}")
+
+    def _collect_synthesis(
+        self,
+        synthesis: Dict[str, Any],
+        entity_ids: List[str],
+        mention_map: Dict[str, List[str]],
+        pair_map: Dict[Tuple[str, str], List[str]]
+    ) -> None:
+        """Record the mentions and co-occurring entity pairs of one synthesis."""
+        synthesis_id = synthesis.get("id", "")
+        try:
+            if entity_ids and not self.dry_run:
+                for entity_id in entity_ids:
+                    mention_map[entity_id].append(synthesis_id)
+
+                for pair in itertools.combinations(sorted(set(entity_ids)), 2):
+                    pair_map[pair].append(synthesis_id)
 
+            if synthesis.get("key_entities"):
                 self.stats["syntheses_processed"] += 1
 
                 if self.stats["syntheses_processed"] % 10 == 0:
                     logger.info(f"Processed {self.stats['syntheses_processed']} syntheses...")
 
-            except Exception as e:
-                logger.error(f"Error processing synthesis {synthesis.get('id', 'unknown')}: {e}")
-                self.stats["errors"] += 1
+        except Exception as e:
+            logger.error(f"Error processing synthesis {synthesis_id or 'unknown'}: {e}")
+            self.stats["errors"] += 1
 
     async def detect_topics(self, time_window_days: int = 90) -> None:
         """Detect topics from all syntheses."""
@@ -208,6 +431,27 @@ class IntelligenceMigration:
             logger.error(f"Topic detection failed: {e}")
             self.stats["errors"] += 1
 
+    def _aggregate_cached(self, synthesis_ids: List[str], key: str) -> Dict[str, Any]:
+        """
+        Aggregate the causal graphs of a synthesis set, memoized by the set hash.
+
+        Topics often share the same syntheses; identical sets are only
+        aggregated once per run (LRU bounded by AGGREGATION_CACHE_SIZE).
+        key is _synthesis_set_hash(synthesis_ids).
+        """
+        if key in self._aggregation_cache:
+            self._aggregation_cache.move_to_end(key)
+            return self._aggregation_cache[key]
+
+        aggregated = self.causal_aggregator.aggregate_causal_graphs(
+            synthesis_ids=synthesis_ids,
+            include_timeline=True
+        )
+        self._aggregation_cache[key] = aggregated
+        if len(self._aggregation_cache) > AGGREGATION_CACHE_SIZE:
+            self._aggregation_cache.popitem(last=False)
+        return aggregated
+
     async def aggregate_causal_graphs(self) -> None:
         """Aggregate causal graphs for all topics."""
         logger.info("Aggregating causal graphs for topics...")
@@ -218,8 +462,10 @@ class IntelligenceMigration:
 
         try:
             # Get all topics
-            topics = self.qdrant.get_topics(limit=100)
+            topics = await asyncio.to_thread(self.qdrant.get_topics, limit=100)
 
+            # (topic_id, graph, hash) written concurrently once all graphs are built
+            updates: List[Tuple[str, Dict[str, Any], str]] = []
             for topic in topics:
                 topic_id = topic.get("id", "")
                 synthesis_ids = topic.get("synthesis_ids", [])
@@ -227,22 +473,41 @@ class IntelligenceMigration:
                 if len(synthesis_ids) < 2:
                     continue
 
+                # Graph already built from this exact synthesis set by a previous run
+                set_hash = _synthesis_set_hash(synthesis_ids)
+                if topic.get("synthesis_ids_hash") == set_hash:
+                    self.stats["causal_graphs_unchanged"] += 1
+                    continue
+
                 try:
-                    aggregated = self.causal_aggregator.aggregate_causal_graphs(
-                        synthesis_ids=synthesis_ids,
-                        include_timeline=True
-                    )
+                    aggregated = self._aggregate_cached(synthesis_ids, set_hash)
 
                     if aggregated.get("nodes"):
-                        self.qdrant.update_topic_causal_graph(topic_id, aggregated)
-                        self.stats["causal_graphs_aggregated"] += 1
-                        logger.debug(f"Aggregated graph for topic {topic_id[:8]}... "
-                                   f"({len(aggregated['nodes'])} nodes)")
+                        updates.append((topic_id, aggregated, set_hash))
 
                 except Exception as e:
                     logger.warning(f"Failed to aggregate graph for topic {topic_id}: {e}")
                     self.stats["errors"] += 1
 
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        self.qdrant.update_topic_causal_graph,
+                        topic_id, aggregated, synthesis_ids_hash=set_hash
+                    )
+                    for topic_id, aggregated, set_hash in updates
+                ),
+                return_exceptions=True
+            )
+            for (topic_id, aggregated, _), result in zip(updates, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to aggregate graph for topic {topic_id}: {result}")
+                    self.stats["errors"] += 1
+                    continue
+                self.stats["causal_graphs_aggregated"] += 1
+                logger.debug(f"Aggregated graph for topic {topic_id[:8]}... "
+                           f"({len(aggregated['nodes'])} nodes)")
+
             logger.success(f"Aggregated {self.stats['causal_graphs_aggregated']} causal graphs")
 
         except Exception as e:
@@ -271,30 +536,20 @@ class IntelligenceMigration:
                 logger.warning("Data already exists. Use --force to re-migrate.")
                 return self.stats
 
-        # Get all syntheses
-        logger.info("Fetching syntheses...")
-        try:
-            syntheses = self.qdrant.get_recent_syntheses(hours=24 * 365, limit=1000)  # Last year
-            logger.info(f"Found {len(syntheses)} syntheses to process")
-        except Exception as e:
-            logger.error(f"Failed to fetch syntheses: {e}")
-            return self.stats
-
-        if not syntheses:
-            logger.warning("No syntheses found to migrate")
-            return self.stats
-
-        # Step 1: Migrate entities
+        # Steps 1 + 2 run concurrently: topic detection clusters the stored
+        # synthesis vectors and does not depend on resolved entities.
         logger.info("-" * 40)
-        logger.info("Step 1: Migrating Entities")
+        logger.info("Step 1: Migrating Entities | Step 2: Detecting Topics")
         logger.info("-" * 40)
-        await self.migrate_entities(syntheses)
+        syntheses_found, _ = await asyncio.gather(
+            self.migrate_all_entities(),
+            self.detect_topics()
+        )
 
-        # Step 2: Detect topics
-        logger.info("-" * 40)
-        logger.info("Step 2: Detecting Topics")
-        logger.info("-" * 40)
-        await self.detect_topics()
+        if not syntheses_found:
+            logger.warning("No syntheses found to migrate")
+            return self.stats
+        logger.info(f"Found {syntheses_found} syntheses")
 
         # Step 3: Aggregate causal graphs
         logger.info("-" * 40)
@@ -314,6 +569,7 @@ class IntelligenceMigration:
         logger.info(f"Topics created: {self.stats['topics_created']}")
         logger.info(f"Topics updated: {self.stats['topics_updated']}")
         logger.info(f"Causal graphs aggregated: {self.stats['causal_graphs_aggregated']}")
+        logger.info(f"Causal graphs unchanged: {self.stats['causal_graphs_unchanged']}")
         logger.info(f"Errors: {self.stats['errors']}")
 
         return self.stats
@@ -324,13 +580,15 @@ async def main():
     parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes")
     parser.add_argument("--force", action="store_true", help="Force re-migration even if data exists")
     parser.add_argument("--batch-size", type=int, default=50, help="Number of syntheses to process at once")
+    parser.add_argument("--no-cache", action="store_true", help="Discard the on-disk entity resolution cache")
 
     args = parser.parse_args()
 
     migration = IntelligenceMigration(
         dry_run=args.dry_run,
         force=args.force,
-        batch_size=args.batch_size
+        batch_size=args.batch_size,
+        use_cache=not args.no_cache
     )
 
     try:
@@ -340,11 +598,13 @@ async def main():
         logger.warning("Migration interrupted by user")
         sys.exit(130)
     except Exception as e:
-        logger.error(f"Migration failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"Migration failed: {e}")
         sys.exit(1)
+    finally:
+        migration.close()
 
 
 if __name__ == "__main__":
+    install_fast_event_loop()  # uvloop/winloop when installed
+
     asyncio.run(main())
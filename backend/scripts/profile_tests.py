@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test suite profiling with Scalene.
+
+Runs pytest under Scalene (line-level CPU + system time, restricted to the
+app/ package) and fails if a single line of application code takes more
+than a given share of the run. System time is the time a line spends
+blocked outside Python (network, SQLite, awaits on I/O), so it points at
+the slow awaits; Python/native CPU points at compute hotspots.
+
+Usage:
+    cd backend
+    python scripts/profile_tests.py                              # tests/test_api_syntheses.py
+    python scripts/profile_tests.py tests/test_search.py --threshold 15
+    python scripts/profile_tests.py --check-only scalene_tests.json
+
+Requires: pip install scalene
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+DEFAULT_TESTS = ["tests/test_api_syntheses.py"]
+DEFAULT_OUTFILE = "scalene_tests.json"
+# Max % of the total profiled time a single app/ line may account for
+DEFAULT_THRESHOLD = 20.0
+
+
+def run_profile(tests: List[str], outfile: str) -> int:
+    """Run pytest under Scalene, writing the JSON profile to outfile."""
+    cmd = [
+        sys.executable, "-m", "scalene",
+        "--cli", "--json", "--outfile", outfile,
+        "--cpu", "--profile-only", "app",
+        "-m", "pytest",
+        "---", "-q", "-p", "no:cacheprovider", *tests,
+    ]
+    print(f"Profiling: {' '.join(tests)}")
+    return subprocess.run(cmd).returncode
+
+
+def find_hot_lines(profile: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Lines whose CPU (Python + native) + system time exceeds threshold %."""
+    hot = []
+    for filename, data in profile.get("files", {}).items():
+        for line in data.get("lines", []):
+            total = (
+                line.get("n_cpu_percent_python", 0.0)
+                + line.get("n_cpu_percent_c", 0.0)
+                + line.get("n_sys_percent", 0.0)
+            )
+            if total > threshold:
+                hot.append({
+                    "file": filename,
+                    "lineno": line.get("lineno"),
+                    "line": line.get("line", "").strip(),
+                    "total": total,
+                    "sys": line.get("n_sys_percent", 0.0),
+                })
+    return sorted(hot, key=lambda h: h["total"], reverse=True)
+
+
+def check_profile(outfile: str, threshold: float) -> int:
+    """Report lines over threshold. Returns the process exit code."""
+    path = Path(outfile)
+    if not path.exists():
+        print(f"Profile not found: {outfile}")
+        return 1
+
+    profile = json.loads(path.read_text(encoding="utf-8"))
+    print(f"Elapsed: {profile.get('elapsed_time_sec', 0):.2f}s")
+
+    hot = find_hot_lines(profile, threshold)
+    if not hot:
+        print(f"No app/ line above {threshold:.1f}% of profiled time")
+        return 0
+
+    print(f"{len(hot)} app/ line(s) above {threshold:.1f}% of profiled time:")
+    for h in hot:
+        print(f"  {h['total']:5.1f}% (sys {h['sys']:4.1f}%)  {h['file']}:{h['lineno']}  {h['line'][:80]}")
+    return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile the test suite with Scalene")
+    parser.add_argument("tests", nargs="*", default=DEFAULT_TESTS, help="Test files to run")
+    parser.add_argument("--outfile", default=DEFAULT_OUTFILE, help="Scalene JSON output")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Fail if a single line exceeds this %% of profiled time")
+    parser.add_argument("--check-only", metavar="PROFILE",
+                        help="Only check an existing Scalene JSON profile")
+    args = parser.parse_args()
+
+    if args.check_only:
+        sys.exit(check_profile(args.check_only, args.threshold))
+
+    returncode = run_profile(args.tests, args.outfile)
+    if returncode != 0:
+        print(f"pytest under Scalene exited with {returncode}")
+        sys.exit(returncode)
+
+    sys.exit(check_profile(args.outfile, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
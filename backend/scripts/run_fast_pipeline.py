@@ -24,7 +24,105 @@ from app.services.pipeline import pipeline_engine
 from app.ml.embeddings import init_embedding_model
 from app.ml.knowledge_graph import init_knowledge_graph
 from app.db.qdrant_client import init_qdrant
+from app.core.event_loop import install_fast_event_loop
 from loguru import logger
+from itertools import chain
+
+# Sources organisées par région/thème pour meilleur clustering
+SOURCES_BY_REGION: dict[str, tuple[str, ...]] = {
+    "france": (
+        "lemonde.fr",
+        "lefigaro.fr",
+        "liberation.fr",
+        "leparisien.fr",
+        "francetvinfo.fr",
+    ),
+    "france_economie": (
+        "lesechos.fr",
+        "latribune.fr",
+    ),
+    "france_science_tech": (
+        "futura-sciences.com",
+        "frandroid.com",
+    ),
+    "europe": (
+        "lesoir.be",           # Belgique
+        "spiegel.de",          # Allemagne
+        "bild.de",             # Allemagne
+        "elpais.com",          # Espagne
+        "elmundo.es",          # Espagne
+        "corriere.it",         # Italie
+        "repubblica.it",       # Italie
+    ),
+    "uk": (
+        "bbc.com",
+        "theguardian.com",
+        "ft.com",              # Finance
+    ),
+    "usa": (
+        "edition.cnn.com",
+        "nytimes.com",
+        "washingtonpost.com",
+        "reuters.com",
+    ),
+    "usa_tech": (
+        "techcrunch.com",
+        "theverge.com",
+        "wired.com",
+    ),
+    "usa_finance": (
+        "bloomberg.com",
+    ),
+    "moyen_orient": (
+        "aljazeera.com",
+    ),
+    "asie": (
+        "asahi.com",                      # Japon
+        "timesofindia.indiatimes.com",    # Inde
+        # NOTE: scmp.com, japantimes.co.jp, koreaherald.com removed (blocked by robots.txt)
+    ),
+    "amerique_sud": (
+        "oglobo.globo.com",    # Brésil
+    ),
+    "oceanie": (
+        "smh.com.au",          # Australie
+    ),
+    "science": (
+        "sciencedaily.com",
+    ),
+    "sport": (
+        "lequipe.fr",
+        "espn.com",
+        "marca.com",
+    ),
+    "culture_societe": (
+        "slate.fr",
+        "theconversation.com",
+        "huffingtonpost.fr",
+    ),
+    "environnement": (
+        "reporterre.net",
+    ),
+    "international": (
+        # NOTE: rt.com removed (blocked by EU sanctions - DNS fails)
+        "dw.com",                # Allemagne (anglais)
+        "rfi.fr",                # France International
+        "france24.com",          # France International
+        "abc.net.au",            # Australie
+        "cbc.ca",                # Canada
+    ),
+    "afrique": (
+        "jeuneafrique.com",
+        "lematin.ma",            # Maroc
+    ),
+    "amerique_latine": (
+        "clarin.com",            # Argentine
+        "eluniversal.com.mx",    # Mexique
+    ),
+}
+
+ALL_SOURCES: tuple[str, ...] = tuple(chain.from_iterable(SOURCES_BY_REGION.values()))
+
 
 async def run_fast_pipeline():
     print("🚀 Starting FAST Pipeline Test...")
@@ -43,102 +141,8 @@ async def run_fast_pipeline():
         print(f"✅ Qdrant returned {len(recent)} recent articles")
 
         # Run Pipeline on ALL available sources for maximum coverage
-        # Sources organisées par région/thème pour meilleur clustering
-        sources_to_test = [
-            # === FRANCE (Généraliste) ===
-            "lemonde.fr",
-            "lefigaro.fr",
-            "liberation.fr",
-            "leparisien.fr",
-            "francetvinfo.fr",
-
-            # === FRANCE (Économie) ===
-            "lesechos.fr",
-            "latribune.fr",
-
-            # === FRANCE (Science/Tech) ===
-            "futura-sciences.com",
-            "frandroid.com",
-
-            # === EUROPE ===
-            "lesoir.be",           # Belgique
-            "spiegel.de",          # Allemagne
-            "bild.de",             # Allemagne
-            "elpais.com",          # Espagne
-            "elmundo.es",          # Espagne
-            "corriere.it",         # Italie
-            "repubblica.it",       # Italie
-
-            # === UK ===
-            "bbc.com",
-            "theguardian.com",
-            "ft.com",              # Finance
-
-            # === USA ===
-            "edition.cnn.com",
-            "nytimes.com",
-            "washingtonpost.com",
-            "reuters.com",
-
-            # === USA (Tech) ===
-            "techcrunch.com",
-            "theverge.com",
-            "wired.com",
-
-            # === USA (Finance) ===
-            "bloomberg.com",
-
-            # === MOYEN-ORIENT ===
-            "aljazeera.com",
-
-            # === ASIE ===
-            "asahi.com",                      # Japon
-            "timesofindia.indiatimes.com",    # Inde
-
-            # === AMÉRIQUE DU SUD ===
-            "oglobo.globo.com",    # Brésil
-
-            # === OCÉANIE ===
-            "smh.com.au",          # Australie
-
-            # === SCIENCE ===
-            "sciencedaily.com",
-
-            # === SPORT ===
-            "lequipe.fr",
-            "espn.com",
-            "marca.com",
-
-            # === CULTURE & SOCIÉTÉ ===
-            "slate.fr",
-            "theconversation.com",
-            "huffingtonpost.fr",
-
-            # === ENVIRONNEMENT ===
-            "reporterre.net",
-
-            # === INTERNATIONAL (Asie) ===
-            # NOTE: scmp.com, japantimes.co.jp, koreaherald.com removed (blocked by robots.txt)
-
-            # === INTERNATIONAL (Autres) ===
-            # NOTE: rt.com removed (blocked by EU sanctions - DNS fails)
-            "dw.com",                # Allemagne (anglais)
-            "rfi.fr",                # France International
-            "france24.com",          # France International
-            "abc.net.au",            # Australie
-            "cbc.ca",                # Canada
-
-            # === AFRIQUE ===
-            "jeuneafrique.com",
-            "lematin.ma",            # Maroc
-
-            # === AMÉRIQUE LATINE ===
-            "clarin.com",            # Argentine
-            "eluniversal.com.mx",    # Mexique
-        ]
-
         results = await pipeline_engine.run_full_pipeline(
-            sources=sources_to_test,
+            sources=list(ALL_SOURCES),
             mode="SCRAPE",
             max_articles_per_source=5  # 5 articles par source
         )
@@ -156,10 +160,10 @@ async def run_fast_pipeline():
             print(f"Raw articles count: {results.get('raw_articles')}")
 
     except Exception as e:
-        logger.error(f"❌ Pipeline failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ Pipeline failed: {e}")
         raise
 
 if __name__ == "__main__":
+    install_fast_event_loop()  # uvloop/winloop when installed
+
     asyncio.run(run_fast_pipeline())
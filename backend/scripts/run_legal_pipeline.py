@@ -15,6 +15,8 @@ from datetime import datetime
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app.core.event_loop import install_fast_event_loop
+
 # Fix Windows console encoding
 os.environ['PYTHONIOENCODING'] = 'utf-8'
 if hasattr(sys.stdout, 'reconfigure'):
@@ -67,4 +69,6 @@ if __name__ == "__main__":
     parser.add_argument("--sources", nargs="*", help="Specific sources to scrape (e.g., CNIL Legifrance)")
     args = parser.parse_args()
 
+    install_fast_event_loop()  # uvloop/winloop when installed
+
     asyncio.run(main(category=args.category, sources=args.sources))
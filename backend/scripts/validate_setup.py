@@ -8,7 +8,7 @@ Ce script vérifie que tous les prérequis sont installés et configurés correc
 Usage:
     cd backend
     source venv/bin/activate
-    python scripts/validate_setup.py
+    python scripts/validate_setup.py [--download]
 
 Auteur: Claude Code Assistant
 Date: 2025-11-24
@@ -17,9 +17,14 @@ Version: 1.0.0
 
 import sys
 import os
+import io
+import argparse
+import importlib.util
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Tuple, List, Dict
+from typing import Any, Callable, Tuple, List, Dict
 
 # Colors pour output terminal
 class Colors:
@@ -30,6 +35,21 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Sortie des checks exécutés en parallèle: un buffer par thread, vidé dans l'ordre
+_output = threading.local()
+
+def _out():
+    """Flux de sortie courant (buffer du check en cours, sinon stdout)"""
+    return getattr(_output, "buffer", None) or sys.stdout
+
+def _run_buffered(check: Callable[[], Any]) -> Tuple[Any, str]:
+    """Exécute un check en capturant ses messages"""
+    _output.buffer = io.StringIO()
+    try:
+        return check(), _output.buffer.getvalue()
+    finally:
+        _output.buffer = None
+
 def print_header(text: str):
     """Affiche un header formaté"""
     print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.END}")
@@ -38,19 +58,19 @@ def print_header(text: str):
 
 def print_success(text: str):
     """Affiche un message de succès"""
-    print(f"{Colors.GREEN}✅ {text}{Colors.END}")
+    print(f"{Colors.GREEN}✅ {text}{Colors.END}", file=_out())
 
 def print_error(text: str):
     """Affiche un message d'erreur"""
-    print(f"{Colors.RED}❌ {text}{Colors.END}")
+    print(f"{Colors.RED}❌ {text}{Colors.END}", file=_out())
 
 def print_warning(text: str):
     """Affiche un avertissement"""
-    print(f"{Colors.YELLOW}⚠️  {text}{Colors.END}")
+    print(f"{Colors.YELLOW}⚠️  {text}{Colors.END}", file=_out())
 
 def print_info(text: str):
     """Affiche une information"""
-    print(f"{Colors.BLUE}ℹ️  {text}{Colors.END}")
+    print(f"{Colors.BLUE}ℹ️  {text}{Colors.END}", file=_out())
 
 def check_python_version() -> bool:
     """Vérifie la version Python (>= 3.8)"""
@@ -83,15 +103,15 @@ def check_docker_services() -> Dict[str, bool]:
     }
 
     try:
-        # Lister les conteneurs actifs
+        # Lister uniquement les conteneurs actifs du projet
         result = subprocess.run(
-            ["docker", "ps", "--format", "{{.Names}}"],
+            ["docker", "ps", "--filter", "name=tradingbot_v2-", "--format", "{{.Names}}"],
             capture_output=True,
             text=True,
             check=True
         )
 
-        running_containers = result.stdout.strip().split('\n')
+        running_containers = set(result.stdout.split())
 
         for service, container_name in containers_map.items():
             if container_name in running_containers:
@@ -185,13 +205,16 @@ def check_env_file() -> bool:
     ]
 
     try:
+        # Une seule passe: clé -> valeur (commentaires ignorés)
+        env_values = {}
         with open(env_path) as f:
-            env_content = f.read()
+            for line in f:
+                line = line.strip()
+                if "=" in line and not line.startswith("#"):
+                    key, value = line.split("=", 1)
+                    env_values[key.strip()] = value.strip()
 
-        missing_vars = []
-        for var in critical_vars:
-            if var not in env_content or f"{var}=" not in env_content:
-                missing_vars.append(var)
+        missing_vars = [var for var in critical_vars if var not in env_values]
 
         if missing_vars:
             print_warning(f"Variables manquantes: {', '.join(missing_vars)}")
@@ -199,9 +222,10 @@ def check_env_file() -> bool:
             print_success("Toutes les variables critiques présentes")
 
         # Vérifier le port Redis (6380 vs 6379)
-        if "REDIS_URL=redis://localhost:6380" in env_content:
+        redis_url = env_values.get("REDIS_URL", "")
+        if redis_url.startswith("redis://localhost:6380"):
             print_success("REDIS_URL configuré avec le bon port (6380)")
-        elif "REDIS_URL=redis://localhost:6379" in env_content:
+        elif redis_url.startswith("redis://localhost:6379"):
             print_error("REDIS_URL utilise le mauvais port (6379 au lieu de 6380)")
             return False
 
@@ -256,27 +280,42 @@ def check_pytorch() -> bool:
         print_info("   Installer avec: pip install torch==2.4.1")
         return False
 
-def check_sentence_transformers() -> bool:
+def _hf_model_cached(repo_id: str) -> bool:
+    """Vérifie si un modèle HuggingFace est présent dans le cache local (sans le charger)"""
+    hub_cache = os.environ.get("HF_HUB_CACHE") or os.path.join(
+        os.environ.get("HF_HOME", str(Path.home() / ".cache" / "huggingface")), "hub"
+    )
+    return (Path(hub_cache) / f"models--{repo_id.replace('/', '--')}").exists()
+
+def check_sentence_transformers(download: bool = False) -> bool:
     """Vérifie l'installation de sentence-transformers (BGE-M3)"""
     print_info("Vérification sentence-transformers...")
 
-    try:
-        from sentence_transformers import SentenceTransformer
-
-        # Vérifier si le modèle BGE-M3 est téléchargé
-        try:
-            model = SentenceTransformer('BAAI/bge-m3')
-            print_success("sentence-transformers installed + BGE-M3 model downloaded")
-            return True
-        except:
-            print_warning("sentence-transformers installed but BGE-M3 NOT downloaded")
-            print_info("   Le modèle sera téléchargé au premier usage (peut prendre quelques minutes)")
-            return True
-    except ImportError:
+    # find_spec: pas d'import (torch) ni de chargement des poids (~2 Go) pour vérifier
+    if importlib.util.find_spec("sentence_transformers") is None:
         print_error("sentence-transformers NOT installed")
         print_info("   Installer avec: pip install sentence-transformers==3.2.1")
         return False
 
+    if _hf_model_cached("BAAI/bge-m3"):
+        print_success("sentence-transformers installed + BGE-M3 model downloaded")
+        return True
+
+    if not download:
+        print_warning("sentence-transformers installed but BGE-M3 NOT downloaded")
+        print_info("   Le modèle sera téléchargé au premier usage (ou relancer avec --download)")
+        return True
+
+    # Téléchargement explicite demandé (--download)
+    try:
+        from sentence_transformers import SentenceTransformer
+        SentenceTransformer('BAAI/bge-m3')
+        print_success("sentence-transformers installed + BGE-M3 model downloaded")
+    except Exception as e:
+        print_warning(f"BGE-M3 download failed: {e}")
+        print_info("   Le modèle sera téléchargé au premier usage (peut prendre quelques minutes)")
+    return True
+
 def check_critical_packages() -> Dict[str, bool]:
     """Vérifie l'installation des packages critiques"""
     print_info("Vérification packages Python critiques...")
@@ -331,6 +370,11 @@ def generate_report(checks: Dict[str, bool]) -> Tuple[int, int]:
 
 def main():
     """Fonction principale"""
+    parser = argparse.ArgumentParser(description="NovaPress AI v2 - Validation setup")
+    parser.add_argument("--download", action="store_true",
+                        help="Télécharger/charger BGE-M3 s'il n'est pas dans le cache HuggingFace")
+    args = parser.parse_args()
+
     print_header("NOVAPRESS AI V2 - VALIDATION SETUP")
     print(f"{Colors.BOLD}Date:{Colors.END} 2025-11-24")
     print(f"{Colors.BOLD}Version:{Colors.END} 1.0.0\n")
@@ -341,29 +385,48 @@ def main():
     print_header("1. ENVIRONNEMENT PYTHON")
     checks["python_version"] = check_python_version()
 
+    # Checks indépendants (subprocess docker, imports lourds torch/spaCy) lancés en
+    # parallèle: la durée totale est celle du plus lent. Sorties affichées dans l'ordre.
+    probes = {
+        "docker_services": check_docker_services,
+        "docker_health": check_docker_health,
+        "env_file": check_env_file,
+        "spacy_model": check_spacy_model,
+        "pytorch": check_pytorch,
+        "sentence_transformers": lambda: check_sentence_transformers(download=args.download),
+        "packages": check_critical_packages,
+    }
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {name: executor.submit(_run_buffered, probe) for name, probe in probes.items()}
+
+    def collect(name: str) -> Any:
+        result, output = futures[name].result()
+        sys.stdout.write(output)
+        return result
+
     # 2. Docker services
     print_header("2. SERVICES DOCKER")
-    docker_services = check_docker_services()
+    docker_services = collect("docker_services")
     checks.update({f"docker_{k}": v for k, v in docker_services.items()})
 
     # 3. Docker health
     print_header("3. SANTÉ SERVICES DOCKER")
-    docker_health = check_docker_health()
+    docker_health = collect("docker_health")
     checks.update({f"health_{k}": v for k, v in docker_health.items()})
 
     # 4. Fichier .env
     print_header("4. CONFIGURATION (.env)")
-    checks["env_file"] = check_env_file()
+    checks["env_file"] = collect("env_file")
 
     # 5. Modèles ML
     print_header("5. MODÈLES MACHINE LEARNING")
-    checks["spacy_model"] = check_spacy_model()
-    checks["pytorch"] = check_pytorch()
-    checks["sentence_transformers"] = check_sentence_transformers()
+    checks["spacy_model"] = collect("spacy_model")
+    checks["pytorch"] = collect("pytorch")
+    checks["sentence_transformers"] = collect("sentence_transformers")
 
     # 6. Packages Python
     print_header("6. PACKAGES PYTHON CRITIQUES")
-    packages = check_critical_packages()
+    packages = collect("packages")
     checks.update({f"package_{k}": v for k, v in packages.items()})
 
     # 7. Rapport final
@@ -1,159 +1,265 @@
 #!/usr/bin/env python3
 """
-Simple Flask API for NovaPress AI v2 - Serves syntheses data
+Simple FastAPI API for NovaPress AI v2 - Serves syntheses data
 """
-from flask import Flask, jsonify, request
-from flask_cors import CORS
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+import asyncio
+import queue
 import sqlite3
 import json
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
 import os
+import time
 
-app = Flask(__name__)
-CORS(app)  # Enable CORS for React app
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class APIResponse(JSONResponse):
+    """JSON response returned directly by the routes, encoded with orjson when installed"""
+
+    def render(self, content) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(content)
+        return super().render(content)
+
+
+app = FastAPI(title="NovaPress AI v2 - Simple API")
+app.add_middleware(  # Enable CORS for React app
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
 # Database path
 DB_PATH = "data/articles.db"
 
+# Reusable connections, opened on first use (at most one per concurrent request)
+_POOL: "queue.SimpleQueue[sqlite3.Connection]" = queue.SimpleQueue()
+
+# /api/status is polled by the dashboard: counts are reused for this long
+STATUS_CACHE_TTL = 1.0
+_status_cache = (0.0, None)  # (monotonic timestamp, (topics_count, syntheses_count))
+
+# Both queries select these columns, in this order, as plain tuples
+SYNTHESES_COLUMNS = "id, titre, contenu, date_creation, themes, sources"
+DEFAULT_TAGS = ['Général']
+
+# /api/syntheses pagination
+MAX_PAGE_SIZE = 100
+
+# Constant SQL text: each pooled connection prepares a statement once and
+# reuses it from its statement cache (keyed by the SQL string)
+_SQL_TOPICS = f"""
+    SELECT {SYNTHESES_COLUMNS}
+    FROM topics
+    ORDER BY date_creation DESC
+    LIMIT ? OFFSET ?
+"""
+_SQL_SYNTHESES = """
+    SELECT id, title as titre, content as contenu, created_at as date_creation,
+           themes, sources
+    FROM syntheses
+    ORDER BY created_at DESC
+    LIMIT ? OFFSET ?
+"""
+_SQL_HAS_TOPICS = "SELECT EXISTS(SELECT 1 FROM topics)"
+_SQL_STATUS = "SELECT (SELECT COUNT(*) FROM topics), (SELECT COUNT(*) FROM syntheses)"
+
+# Serve ORDER BY date DESC LIMIT n from the index instead of sorting the table
+_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_topics_date ON topics(date_creation DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_syntheses_date ON syntheses(created_at DESC)",
+)
+
 def get_db_connection():
     """Get database connection"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
+        # Shared across worker threads through the pool; autocommit mode
+        conn = sqlite3.connect(
+            DB_PATH, check_same_thread=False, isolation_level=None, cached_statements=256
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        _ensure_indexes(conn)
         return conn
     except Exception as e:
         print(f"Database connection error: {e}")
         return None
 
-def format_synthesis(row):
-    """Format synthesis data for API response"""
-    try:
-        return {
-            'id': row['id'],
-            'titre': row.get('titre', row.get('title', 'Sans titre')),
-            'contenu': row.get('contenu', row.get('content', row.get('summary', 'Contenu non disponible')))[:500],
-            'date': row.get('date_creation', row.get('created_at', datetime.now().isoformat())),
-            'tags': json.loads(row.get('themes', '[]')) if row.get('themes') and row.get('themes') != '[]' else ['Général'],
-            'sources': json.loads(row.get('sources', '[]')) if row.get('sources') and row.get('sources') != '[]' else []
-        }
-    except Exception as e:
-        print(f"Error formatting synthesis: {e}")
-        return None
+def _ensure_indexes(conn):
+    """Create the date indexes if missing (tables may not exist yet)"""
+    for statement in _INDEXES:
+        try:
+            conn.execute(statement)
+        except sqlite3.Error:
+            pass
 
-@app.route('/api/syntheses', methods=['GET'])
-def get_syntheses():
-    """Get all syntheses"""
+@contextmanager
+def borrow():
+    """Borrow a pooled connection (None if the database is unreachable)"""
     try:
+        conn = _POOL.get_nowait()
+    except queue.Empty:
         conn = get_db_connection()
+    try:
+        yield conn
+    finally:
+        if conn is not None:
+            _POOL.put(conn)
+
+@lru_cache(maxsize=4096)
+def _decode_json_list(value):
+    """Decode a JSON list column once per distinct value (None if malformed)"""
+    try:
+        decoded = json.loads(value)
+    except (ValueError, TypeError):
+        return None
+    return tuple(decoded) if isinstance(decoded, list) else decoded
+
+def _parse_json_list(value, default):
+    """Parse a JSON list column, skipping the common empty cases"""
+    if not value or value == '[]':
+        return default
+    decoded = _decode_json_list(value)
+    if decoded is None:
+        return default
+    # Fresh list per row: the cached value is shared
+    return list(decoded) if isinstance(decoded, tuple) else decoded
+
+def format_synthesis(row):
+    """Format synthesis data for API response (row in SYNTHESES_COLUMNS order)"""
+    id_, titre, contenu, date_creation, themes, sources = row
+    return {
+        'id': id_,
+        'titre': titre or 'Sans titre',
+        'contenu': (contenu or 'Contenu non disponible')[:500],
+        'date': date_creation or datetime.now().isoformat(),
+        'tags': _parse_json_list(themes, DEFAULT_TAGS),
+        'sources': _parse_json_list(sources, [])
+    }
+
+def _fetch_syntheses(limit=MAX_PAGE_SIZE, offset=0):
+    """Read and format a page of syntheses, None if the DB is unreachable (blocking)"""
+    with borrow() as conn:
         if not conn:
-            return jsonify({'error': 'Database connection failed'}), 500
-        
-        # Try topics table first (main table)
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT id, titre, contenu, date_creation, themes, sources 
-            FROM topics 
-            ORDER BY date_creation DESC 
-            LIMIT 100
-        """)
-        
-        topics = cursor.fetchall()
-        syntheses = []
-        
-        for row in topics:
-            formatted = format_synthesis(row)
-            if formatted:
-                syntheses.append(formatted)
-        
-        # If no topics found, try syntheses table
-        if not syntheses:
-            cursor.execute("""
-                SELECT id, title as titre, content as contenu, created_at as date_creation, 
-                       themes, sources 
-                FROM syntheses 
-                ORDER BY created_at DESC 
-                LIMIT 100
-            """)
-            
-            synthesis_rows = cursor.fetchall()
-            for row in synthesis_rows:
-                formatted = format_synthesis(row)
-                if formatted:
-                    syntheses.append(formatted)
-        
-        conn.close()
-        
-        return jsonify({
+            return None
+        return _query_syntheses(conn, limit, offset)
+
+def _query_syntheses(conn, limit, offset):
+    """Latest syntheses from the topics table, falling back to syntheses"""
+    # Topics is the main table; syntheses is only used when topics is empty.
+    # Decided on the whole table, not the page, so every page reads the same one.
+    (has_topics,) = conn.execute(_SQL_HAS_TOPICS).fetchone()
+    sql = _SQL_TOPICS if has_topics else _SQL_SYNTHESES
+    rows = conn.execute(sql, (limit, offset)).fetchall()
+
+    return [format_synthesis(row) for row in rows]
+
+def _fetch_counts():
+    """Count topics and syntheses, None if the DB is unreachable (blocking)"""
+    global _status_cache
+    cached_at, counts = _status_cache
+    if counts is not None and time.monotonic() - cached_at < STATUS_CACHE_TTL:
+        return counts
+
+    with borrow() as conn:
+        if not conn:
+            return None
+
+        # Both counts in one statement
+        topics_count, syntheses_count = conn.execute(_SQL_STATUS).fetchone()
+
+    _status_cache = (time.monotonic(), (topics_count, syntheses_count))
+    return topics_count, syntheses_count
+
+@app.get('/api/syntheses')
+async def get_syntheses(limit: int = MAX_PAGE_SIZE, offset: int = 0):
+    """Get the latest syntheses (limit capped at MAX_PAGE_SIZE)"""
+    try:
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        offset = max(0, offset)
+        syntheses = await asyncio.to_thread(_fetch_syntheses, limit, offset)
+        if syntheses is None:
+            return APIResponse({'error': 'Database connection failed'}, status_code=500)
+
+        # Returned as a response directly: skips FastAPI's jsonable_encoder pass
+        return APIResponse({
             'syntheses': syntheses,
             'count': len(syntheses),
             'status': 'success'
         })
-        
+
     except Exception as e:
         print(f"API Error: {e}")
-        return jsonify({
+        return APIResponse({
             'syntheses': [],
             'count': 0,
             'error': str(e),
             'status': 'error'
-        }), 500
+        }, status_code=500)
 
-@app.route('/api/reboot/<int:article_id>', methods=['POST'])
-def reboot_article(article_id):
+@app.post('/api/reboot/{article_id}')
+async def reboot_article(article_id: int):
     """Reboot/regenerate an article (placeholder)"""
     try:
         # Simulate reboot process
-        return jsonify({
+        return {
             'success': True,
             'message': f'Article {article_id} en cours de reboot',
             'status': 'processing'
-        })
+        }
     except Exception as e:
-        return jsonify({
+        return APIResponse({
             'success': False,
             'error': str(e)
-        }), 500
+        }, status_code=500)
 
-@app.route('/api/status', methods=['GET'])
-def api_status():
+@app.get('/api/status')
+async def api_status():
     """API health check"""
     try:
-        conn = get_db_connection()
-        if conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) as count FROM topics")
-            topics_count = cursor.fetchone()['count']
-            
-            cursor.execute("SELECT COUNT(*) as count FROM syntheses")  
-            syntheses_count = cursor.fetchone()['count']
-            
-            conn.close()
-            
-            return jsonify({
+        counts = await asyncio.to_thread(_fetch_counts)
+        if counts:
+            topics_count, syntheses_count = counts
+
+            return {
                 'status': 'healthy',
                 'database': 'connected',
                 'topics_count': topics_count,
                 'syntheses_count': syntheses_count,
                 'timestamp': datetime.now().isoformat()
-            })
+            }
         else:
-            return jsonify({
+            return APIResponse({
                 'status': 'unhealthy',
                 'database': 'disconnected',
                 'error': 'Cannot connect to database'
-            }), 500
-            
+            }, status_code=500)
+
     except Exception as e:
-        return jsonify({
+        return APIResponse({
             'status': 'error',
             'error': str(e)
-        }), 500
+        }, status_code=500)
 
 if __name__ == '__main__':
+    import uvicorn
+
     print("Starting NovaPress AI v2 API...")
     print(f"Database path: {DB_PATH}")
     print(f"Database exists: {os.path.exists(DB_PATH)}")
-    
+
     # Test database connection
     conn = get_db_connection()
     if conn:
@@ -161,5 +267,12 @@ if __name__ == '__main__':
         conn.close()
     else:
         print("❌ Database connection failed")
-    
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+
+    # Reloader (file watching, extra process) only when explicitly asked for
+    debug = os.getenv("NOVAPRESS_DEBUG", "0") == "1"
+
+    # loop="auto" picks uvloop when installed (uvicorn[standard])
+    if debug:
+        uvicorn.run("simple_api:app", host='0.0.0.0', port=5000, reload=True, log_level="debug")
+    else:
+        uvicorn.run("simple_api:app", host='0.0.0.0', port=5000, workers=2)
@@ -1,9 +1,14 @@
 """Test API endpoint"""
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 
+# Shared session: keep-alive connections reused across requests
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
 try:
-    response = requests.get("http://localhost:5000/api/syntheses/", params={"limit": 5})
+    response = _SESSION.get("http://localhost:5000/api/syntheses/", params={"limit": 5}, timeout=5)
     data = response.json()
 
     print(f"API returned {len(data.get('data', []))} syntheses")
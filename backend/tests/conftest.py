@@ -2,13 +2,13 @@
 Pytest configuration and fixtures for NovaPress AI v2 tests
 """
 import pytest
-import asyncio
+import pytest_asyncio
 from typing import AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi.testclient import TestClient
 from httpx import AsyncClient, ASGITransport
 
 # Import app after mocking to prevent heavy model loading
+import functools
 import sys
 import os
 from unittest.mock import MagicMock
@@ -27,6 +27,7 @@ _HEAVY_MODULES = [
     "sklearn.preprocessing",
     "sklearn.cluster",
     "sklearn.metrics",
+    "sklearn.metrics.pairwise",
     "hdbscan",
     "umap",
     "umap.umap_",
@@ -48,20 +49,20 @@ _HEAVY_MODULES = [
     "pywebpush",
     "py_vapid",
 ]
-for _mod in _HEAVY_MODULES:
-    if _mod not in sys.modules:
-        sys.modules[_mod] = MagicMock()
+# One mock per root package; submodules are its attributes, so that
+# ``sklearn.cluster`` and ``sys.modules["sklearn.cluster"]`` are the same object.
+# Set NOVAPRESS_MOCK_ML=0 to run against the real packages (integration runs).
+if os.getenv("NOVAPRESS_MOCK_ML", "1") == "1":
+    _root_mocks = {}
+    for _mod in _HEAVY_MODULES:
+        if _mod in sys.modules:
+            continue
+        _root, *_path = _mod.split(".")
+        _root_mock = _root_mocks.setdefault(_root, MagicMock())
+        sys.modules[_mod] = functools.reduce(getattr, _path, _root_mock)
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create event loop for async tests"""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
-@pytest.fixture(scope="module")
 def mock_embedding_service():
     """Mock the embedding service to avoid loading heavy models"""
     mock = MagicMock()
@@ -70,7 +71,7 @@ def mock_embedding_service():
     return mock
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def mock_qdrant_service():
     """Mock Qdrant vector database"""
     mock = MagicMock()
@@ -80,7 +81,7 @@ def mock_qdrant_service():
     return mock
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def mock_llm_service():
     """Mock LLM service for synthesis"""
     mock = AsyncMock()
@@ -93,9 +94,9 @@ def mock_llm_service():
     return mock
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def app(mock_embedding_service, mock_qdrant_service, mock_llm_service):
-    """Create FastAPI app with mocked services"""
+    """Create FastAPI app with mocked services (app.main is only imported once per session)"""
     # Patch heavy services before importing app
     with patch("app.ml.embeddings.embedding_service", mock_embedding_service), \
          patch("app.db.qdrant_client.qdrant_service", mock_qdrant_service):
@@ -103,26 +104,38 @@ def app(mock_embedding_service, mock_qdrant_service, mock_llm_service):
         yield fastapi_app
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def client(app) -> Generator:
     """Synchronous test client"""
+    from fastapi.testclient import TestClient  # deferred: keeps test collection light
+
     with TestClient(app) as c:
         yield c
 
 
-@pytest.fixture(scope="module")
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_client(app) -> AsyncGenerator:
-    """Async test client for testing async endpoints"""
+    """Async test client for testing async endpoints (tests using it need loop_scope="session")"""
     async with AsyncClient(
         transport=ASGITransport(app=app),
-        base_url="http://test"
+        base_url="http://test",
+        follow_redirects=True,  # same behaviour as TestClient
     ) as ac:
         yield ac
 
 
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Make asyncio.sleep return immediately (retry backoff in LLM tests)"""
+    async def _no_sleep(*args, **kwargs):
+        return None
+    monkeypatch.setattr("asyncio.sleep", _no_sleep)
+
+
 # ============= Test Data Fixtures =============
+# Static payloads, built once per module and shared: copy (dict(...)) before modifying
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_user_data():
     """Sample user registration data"""
     return {
@@ -132,7 +145,7 @@ def sample_user_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_article_data():
     """Sample article data"""
     return {
@@ -6,28 +6,20 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 import pytest
 from unittest.mock import patch, MagicMock
-from fastapi.testclient import TestClient
 
 
-@pytest.fixture
-def client():
-    """Create a test client with mocked dependencies."""
-    # Mock Qdrant before importing the app
-    with patch('app.db.qdrant_client.QdrantClient') as mock_qdrant_class:
-        mock_qdrant = MagicMock()
-        mock_qdrant_class.return_value = mock_qdrant
+# ``client`` is the session-wide TestClient from conftest.py
 
-        from app.main import app
-        return TestClient(app)
 
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_qdrant():
-    """Provide a mock Qdrant service."""
-    with patch('app.api.routes.syntheses.get_qdrant_service') as mock:
-        service = MagicMock()
-        mock.return_value = service
-        yield service
+    """Provide a mock Qdrant service, patched once for the whole module."""
+    patcher = patch('app.api.routes.syntheses.get_qdrant_service')
+    mock = patcher.start()
+    service = MagicMock()
+    mock.return_value = service
+    yield service
+    patcher.stop()
 
 
 class TestSynthesesEndpoints:
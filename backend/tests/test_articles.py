@@ -5,68 +5,51 @@ Tests for article listing, retrieval, and filtering
 import pytest
 from fastapi import status
 
+# Read-only endpoint tests: all share the session-scoped async_client and its loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 
 class TestArticlesList:
     """Tests for article listing endpoint"""
     
     @pytest.mark.unit
-    def test_get_articles_default(self, client):
-        """Test getting articles with default parameters"""
-        response = client.get("/api/articles")
-        
-        assert response.status_code == status.HTTP_200_OK
+    @pytest.mark.parametrize("query,ok_codes,max_items", [
+        ("", [status.HTTP_200_OK], None),                         # default parameters
+        ("?limit=5", [status.HTTP_200_OK], 5),                    # limit
+        ("?limit=10&offset=0", [status.HTTP_200_OK], 10),         # pagination
+        ("?limit=-1", [                                           # invalid limit: reject or handle gracefully
+            status.HTTP_200_OK,
+            status.HTTP_400_BAD_REQUEST,
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+        ], None),
+    ])
+    async def test_get_articles(self, async_client, query, ok_codes, max_items):
+        """Test article listing across query-string variations"""
+        response = await async_client.get(f"/api/articles{query}")
+
+        assert response.status_code in ok_codes
+        if response.status_code != status.HTTP_200_OK:
+            return
+
         data = response.json()
-        
+
         # Should return a list of articles or data wrapper
         assert isinstance(data, (list, dict))
         if isinstance(data, dict):
             assert "data" in data or "articles" in data
-    
-    @pytest.mark.unit
-    def test_get_articles_with_limit(self, client):
-        """Test getting articles with limit parameter"""
-        response = client.get("/api/articles?limit=5")
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        
-        # If data is wrapped
+
         articles = data.get("data", data) if isinstance(data, dict) else data
-        if isinstance(articles, list):
-            assert len(articles) <= 5
-    
-    @pytest.mark.unit
-    def test_get_articles_with_offset(self, client):
-        """Test pagination with offset"""
-        response = client.get("/api/articles?limit=10&offset=0")
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        
-        if isinstance(data, dict):
-            # Check pagination metadata
-            assert "total" in data or "hasNext" in data or "page" in data or len(data) >= 0
-    
-    @pytest.mark.unit
-    def test_get_articles_invalid_limit(self, client):
-        """Test with invalid limit parameter"""
-        response = client.get("/api/articles?limit=-1")
-        
-        # Should either reject or handle gracefully
-        assert response.status_code in [
-            status.HTTP_200_OK,  # Handled gracefully
-            status.HTTP_400_BAD_REQUEST,
-            status.HTTP_422_UNPROCESSABLE_ENTITY
-        ]
+        if max_items is not None and isinstance(articles, list):
+            assert len(articles) <= max_items
 
 
 class TestArticleById:
     """Tests for single article retrieval"""
     
     @pytest.mark.unit
-    def test_get_article_not_found(self, client):
+    async def test_get_article_not_found(self, async_client):
         """Test getting non-existent article"""
-        response = client.get("/api/articles/nonexistent-id-12345")
+        response = await async_client.get("/api/articles/nonexistent-id-12345")
         
         assert response.status_code in [
             status.HTTP_404_NOT_FOUND,
@@ -74,9 +57,9 @@ class TestArticleById:
         ]
     
     @pytest.mark.unit
-    def test_get_article_invalid_id_format(self, client):
+    async def test_get_article_invalid_id_format(self, async_client):
         """Test with invalid ID format"""
-        response = client.get("/api/articles/")
+        response = await async_client.get("/api/articles/")
         
         # Trailing slash without ID
         assert response.status_code in [
@@ -90,9 +73,9 @@ class TestTrendingArticles:
     """Tests for trending articles endpoint"""
     
     @pytest.mark.unit
-    def test_get_trending(self, client):
+    async def test_get_trending(self, async_client):
         """Test getting trending articles"""
-        response = client.get("/api/trending")
+        response = await async_client.get("/api/trending")
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -101,9 +84,9 @@ class TestTrendingArticles:
         assert isinstance(data, (list, dict))
     
     @pytest.mark.unit
-    def test_trending_limited_results(self, client):
+    async def test_trending_limited_results(self, async_client):
         """Test that trending returns limited number of results"""
-        response = client.get("/api/trending")
+        response = await async_client.get("/api/trending")
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -118,9 +101,9 @@ class TestArticleRelated:
     """Tests for related articles endpoint"""
     
     @pytest.mark.unit
-    def test_get_related_articles(self, client):
+    async def test_get_related_articles(self, async_client):
         """Test getting related articles for an article"""
-        response = client.get("/api/articles/1/related")
+        response = await async_client.get("/api/articles/1/related")
         
         # May return 404 if article doesn't exist, or 200 with results
         assert response.status_code in [
@@ -133,9 +116,9 @@ class TestHealthCheck:
     """Tests for health check endpoint"""
     
     @pytest.mark.unit
-    def test_health_check(self, client):
+    async def test_health_check(self, async_client):
         """Test health check endpoint"""
-        response = client.get("/health")
+        response = await async_client.get("/health")
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
@@ -1,13 +1,12 @@
 """
 Authentication API Tests - NovaPress AI v2
-Auth is currently stubbed (501 Not Implemented) — PostgreSQL not wired.
-These tests verify the stub behaviour is consistent.
+Skipped until a PostgreSQL test database is wired into the client fixture.
 """
 import pytest
 from fastapi import status
 
 
-@pytest.mark.skip(reason="Auth not implemented — endpoints return 501 by design")
+@pytest.mark.skip(reason="Requires a PostgreSQL test database")
 class TestAuthRegister:
     """Tests for user registration endpoint"""
 
@@ -38,7 +37,7 @@ class TestAuthRegister:
         ]
 
 
-@pytest.mark.skip(reason="Auth not implemented — endpoints return 501 by design")
+@pytest.mark.skip(reason="Requires a PostgreSQL test database")
 class TestAuthLogin:
     """Tests for user login endpoint"""
 
@@ -72,7 +71,7 @@ class TestAuthLogin:
         ]
 
 
-@pytest.mark.skip(reason="Auth not implemented — endpoints return 501 by design")
+@pytest.mark.skip(reason="Requires a PostgreSQL test database")
 class TestAuthProfile:
     """Tests for user profile endpoints"""
 
@@ -89,7 +88,7 @@ class TestAuthProfile:
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
 
-@pytest.mark.skip(reason="Auth not implemented — endpoints return 501 by design")
+@pytest.mark.skip(reason="Requires a PostgreSQL test database")
 class TestAuthTokenRefresh:
     """Tests for token refresh endpoint"""
 
@@ -113,28 +112,3 @@ class TestAuthTokenRefresh:
             status.HTTP_401_UNAUTHORIZED,
             status.HTTP_422_UNPROCESSABLE_ENTITY
         ]
-
-
-@pytest.mark.skip(reason="Auth fully implemented — stubs removed. Use TestAuthRegister/TestAuthLogin.")
-class TestAuthStubs:
-    """Stubs obsolètes — l'auth JWT est maintenant implémentée"""
-
-    @pytest.mark.unit
-    def test_register_returns_501(self, client):
-        response = client.post("/api/auth/register", json={})
-        assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
-
-    @pytest.mark.unit
-    def test_login_returns_501(self, client):
-        response = client.post("/api/auth/login", json={})
-        assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
-
-    @pytest.mark.unit
-    def test_refresh_returns_501(self, client):
-        response = client.post("/api/auth/refresh", json={})
-        assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
-
-    @pytest.mark.unit
-    def test_logout_returns_501(self, client):
-        response = client.post("/api/auth/logout")
-        assert response.status_code == status.HTTP_501_NOT_IMPLEMENTED
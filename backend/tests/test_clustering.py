@@ -10,46 +10,58 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app.ml import clustering as clustering_module
+from sklearn.metrics.pairwise import cosine_similarity
+
+# conftest replaces sklearn with a MagicMock unless NOVAPRESS_MOCK_ML=0
+SKLEARN_MOCKED = isinstance(cosine_similarity, MagicMock)
+
 
 class TestClusteringEngine:
     """Tests for ClusteringEngine class"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def clustering_engine(self):
-        """Create clustering engine with test settings"""
-        with patch("app.ml.clustering.settings") as mock_settings:
+        """Create clustering engine with test settings (shared, read-only)"""
+        with patch.object(clustering_module, "settings") as mock_settings:
             mock_settings.MIN_CLUSTER_SIZE = 3
             mock_settings.MIN_SAMPLES = 2
             mock_settings.CLUSTER_SELECTION_EPSILON = 0.08
             mock_settings.MIN_CLUSTER_SIMILARITY = 0.55
             mock_settings.MAX_CLUSTER_SIZE = 10
 
-            from app.ml.clustering import ClusteringEngine
-            return ClusteringEngine()
+            yield clustering_module.ClusteringEngine()
 
-    @pytest.fixture
+    # Embedding fixtures are built once per class and shared read-only
+    @pytest.fixture(scope="class")
     def similar_embeddings(self):
         """Create embeddings that should cluster together"""
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
         # Create 2 distinct clusters
-        cluster_1 = np.random.randn(5, 128) * 0.1 + [1.0] * 128
-        cluster_2 = np.random.randn(5, 128) * 0.1 + [-1.0] * 128
-        noise = np.random.randn(2, 128)  # Noise points
-        return np.vstack([cluster_1, cluster_2, noise])
+        cluster_1 = rng.standard_normal((5, 128), dtype=np.float32) * 0.1 + 1.0
+        cluster_2 = rng.standard_normal((5, 128), dtype=np.float32) * 0.1 - 1.0
+        noise = rng.standard_normal((2, 128), dtype=np.float32)  # Noise points
+        embeddings = np.vstack([cluster_1, cluster_2, noise])
+        embeddings.setflags(write=False)
+        return embeddings
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def highly_similar_embeddings(self):
         """Create embeddings with very high similarity"""
-        np.random.seed(42)
-        base = np.random.randn(1, 128)
+        rng = np.random.default_rng(42)
+        base = rng.standard_normal((1, 128), dtype=np.float32)
         # Add small noise to create similar vectors
-        return base + np.random.randn(5, 128) * 0.01
+        embeddings = base + rng.standard_normal((5, 128), dtype=np.float32) * 0.01
+        embeddings.setflags(write=False)
+        return embeddings
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def diverse_embeddings(self):
         """Create diverse embeddings that shouldn't cluster"""
-        np.random.seed(42)
-        return np.random.randn(10, 128)
+        rng = np.random.default_rng(42)
+        embeddings = rng.standard_normal((10, 128), dtype=np.float32)
+        embeddings.setflags(write=False)
+        return embeddings
 
     def test_compute_cluster_coherence_high_similarity(self, clustering_engine, highly_similar_embeddings):
         """Test coherence computation for highly similar vectors"""
@@ -109,9 +121,8 @@ class TestClusteringEngine:
         labels, stats = clustering_engine.cluster_articles(embeddings)
 
         # Every non-noise cluster must have >= min_cluster_size members
-        for cluster_id in set(labels):
-            if cluster_id != -1:
-                assert np.sum(labels == cluster_id) >= clustering_engine.min_cluster_size
+        cluster_ids, counts = np.unique(labels, return_counts=True)
+        assert (counts[cluster_ids != -1] >= clustering_engine.min_cluster_size).all()
 
     def test_validate_and_filter_clusters_removes_incoherent(self, clustering_engine):
         """Test that incoherent clusters are filtered out"""
@@ -181,31 +192,29 @@ class TestClusteringEngine:
 class TestClusteringCoherence:
     """Tests for cluster coherence calculations"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def clustering_engine(self):
-        with patch("app.ml.clustering.settings") as mock_settings:
+        with patch.object(clustering_module, "settings") as mock_settings:
             mock_settings.MIN_CLUSTER_SIZE = 2
             mock_settings.MIN_SAMPLES = 1
             mock_settings.CLUSTER_SELECTION_EPSILON = 0.1
             mock_settings.MIN_CLUSTER_SIMILARITY = 0.5
             mock_settings.MAX_CLUSTER_SIZE = 20
 
-            from app.ml.clustering import ClusteringEngine
-            return ClusteringEngine()
+            yield clustering_module.ClusteringEngine()
 
-    def test_coherence_range(self, clustering_engine):
+    @pytest.mark.parametrize("seed", range(10))
+    def test_coherence_range(self, clustering_engine, seed):
         """Test that coherence is always between 0 and 1"""
-        np.random.seed(42)
-
-        for _ in range(10):
-            embeddings = np.random.randn(5, 128)
-            labels = np.zeros(5, dtype=int)
+        rng = np.random.default_rng(seed)
+        embeddings = rng.standard_normal((5, 128), dtype=np.float32)
+        labels = np.zeros(5, dtype=int)
 
-            coherence = clustering_engine._compute_cluster_coherence(
-                embeddings, labels, 0
-            )
+        coherence = clustering_engine._compute_cluster_coherence(
+            embeddings, labels, 0
+        )
 
-            assert -1.0 <= coherence <= 1.0
+        assert -1.0 <= coherence <= 1.0
 
     def test_coherence_symmetric(self, clustering_engine):
         """Test that coherence calculation is symmetric"""
@@ -216,33 +225,87 @@ class TestClusteringCoherence:
         ])
         labels = np.zeros(3, dtype=int)
 
+        # Normalize once, reuse for both orders
+        normalized = clustering_module._l2_normalize(embeddings)
+
         coherence = clustering_engine._compute_cluster_coherence(
-            embeddings, labels, 0
+            normalized, labels, 0, normalized=True
         )
 
         # Should be the same regardless of order
-        embeddings_reversed = embeddings[::-1]
         coherence_reversed = clustering_engine._compute_cluster_coherence(
-            embeddings_reversed, labels, 0
+            normalized[::-1], labels, 0, normalized=True
         )
 
         assert abs(coherence - coherence_reversed) < 0.01
 
 
+@pytest.mark.skipif(SKLEARN_MOCKED, reason="needs real scikit-learn (NOVAPRESS_MOCK_ML=0)")
+class TestMeanPairwiseSimilarity:
+    """GEMM and numba paths of _mean_pairwise_similarity against sklearn's cosine_similarity"""
+
+    # Both sides of SMALL_CLUSTER_JIT_MAX
+    SIZES = [2, 3, clustering_module.SMALL_CLUSTER_JIT_MAX - 1,
+             clustering_module.SMALL_CLUSTER_JIT_MAX, 20]
+
+    @staticmethod
+    def _reference(vectors):
+        """Mean of the strict upper triangle of cosine_similarity"""
+        sim = cosine_similarity(np.asarray(vectors, dtype=np.float64))
+        return sim[np.triu_indices(len(vectors), k=1)].mean()
+
+    @staticmethod
+    def _vectors(n, zero_rows=()):
+        rng = np.random.default_rng(n)
+        vectors = rng.standard_normal((n, 64), dtype=np.float32)
+        vectors[list(zero_rows)] = 0.0
+        return vectors
+
+    @pytest.mark.parametrize("n", SIZES)
+    @pytest.mark.parametrize("zero_rows", [(), (0,)], ids=["dense", "zero-row"])
+    def test_gemm_path(self, n, zero_rows, monkeypatch):
+        """BLAS path (numba disabled) matches sklearn"""
+        monkeypatch.setattr(clustering_module, "NUMBA_AVAILABLE", False)
+        vectors = self._vectors(n, zero_rows)
+
+        result = clustering_module._mean_pairwise_similarity(vectors)
+
+        assert result == pytest.approx(self._reference(vectors), abs=1e-5)
+
+    @pytest.mark.skipif(not clustering_module.NUMBA_AVAILABLE, reason="numba not installed")
+    @pytest.mark.parametrize("n", SIZES)
+    @pytest.mark.parametrize("zero_rows", [(), (0,)], ids=["dense", "zero-row"])
+    def test_numba_kernel(self, n, zero_rows):
+        """JIT kernel on normalized rows matches sklearn, whatever the size"""
+        vectors = self._vectors(n, zero_rows)
+        normalized = clustering_module._l2_normalize(vectors)
+
+        result = clustering_module._mean_pairwise_dot(normalized)
+
+        assert result == pytest.approx(self._reference(vectors), abs=1e-5)
+
+    @pytest.mark.parametrize("n", [2, clustering_module.SMALL_CLUSTER_JIT_MAX + 1])
+    def test_all_zero_rows(self, n):
+        """Zero vectors have similarity 0, like cosine_similarity"""
+        vectors = np.zeros((n, 16), dtype=np.float32)
+
+        assert clustering_module._mean_pairwise_similarity(vectors) == 0.0
+        assert self._reference(vectors) == 0.0
+
+
 class TestClusteringIntegration:
     """Integration tests for full clustering workflow"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def clustering_engine(self):
-        with patch("app.ml.clustering.settings") as mock_settings:
+        with patch.object(clustering_module, "settings") as mock_settings:
             mock_settings.MIN_CLUSTER_SIZE = 3
             mock_settings.MIN_SAMPLES = 2
             mock_settings.CLUSTER_SELECTION_EPSILON = 0.08
             mock_settings.MIN_CLUSTER_SIMILARITY = 0.55
             mock_settings.MAX_CLUSTER_SIZE = 15
 
-            from app.ml.clustering import ClusteringEngine
-            return ClusteringEngine()
+            yield clustering_module.ClusteringEngine()
 
     def test_full_workflow_with_real_data_structure(self, clustering_engine):
         """Test full clustering returns valid labels + stats for realistic embeddings"""
@@ -261,12 +324,14 @@ class TestClusteringIntegration:
 
     def test_clustering_deterministic_with_seed(self, clustering_engine):
         """Test that clustering is deterministic with same seed"""
-        np.random.seed(42)
-        embeddings_1 = np.random.randn(10, 128) * 0.1 + np.tile([1.0] * 128, (10, 1)) * np.arange(10)[:, None] * 0.1
-        articles = [{"id": f"art-{i}"} for i in range(10)]
+        # Row i is offset by 0.1 * i (broadcast, no tiled copy)
+        offsets = 0.1 * np.arange(10, dtype=np.float32)[:, None]
 
-        np.random.seed(42)
-        embeddings_2 = np.random.randn(10, 128) * 0.1 + np.tile([1.0] * 128, (10, 1)) * np.arange(10)[:, None] * 0.1
+        rng = np.random.default_rng(42)
+        embeddings_1 = rng.standard_normal((10, 128), dtype=np.float32) * 0.1 + offsets
+
+        rng = np.random.default_rng(42)
+        embeddings_2 = rng.standard_normal((10, 128), dtype=np.float32) * 0.1 + offsets
 
         # Both should produce same embeddings
         np.testing.assert_array_almost_equal(embeddings_1, embeddings_2)
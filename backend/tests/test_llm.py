@@ -2,200 +2,248 @@
 Unit tests for LLM Service
 Tests generation, retry logic, and JSON parsing
 """
+import json
 import pytest
-import asyncio
+import httpx
+import respx
 from unittest.mock import AsyncMock, MagicMock, patch
-from openai import RateLimitError, APIConnectionError, APITimeoutError, APIError
+from openai import AsyncOpenAI, RateLimitError
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app.ml.llm import LLMService
 
-class TestLLMService:
-    """Tests for LLMService class"""
+# asyncio_mode = auto collects the async tests; run them all on the session loop.
+# Retry backoff never really sleeps (no_sleep, conftest.py).
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.usefixtures("no_sleep"),
+    pytest.mark.xdist_group(name=__name__),  # one worker: shared client/service fixtures
+]
 
-    @pytest.fixture
-    def mock_openai_response(self):
-        """Mock OpenAI chat completion response"""
-        mock_message = MagicMock()
-        mock_message.content = "Test response"
+# Requests go through the real SDK and are answered by a respx router, plugged in
+# as the SDK's http_client transport (no reliance on how the SDK builds its own).
+# max_retries=0: only LLMService's own retry loop is under test.
+MOCK_BASE_URL = "http://mock.openrouter"
+COMPLETIONS_URL = f"{MOCK_BASE_URL}/chat/completions"
 
-        mock_choice = MagicMock()
-        mock_choice.message = mock_message
 
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
+def _chat_response(content):
+    """OpenAI-style chat completion: response.choices[0].message.content"""
+    mock_message = MagicMock()
+    mock_message.content = content
 
-        return mock_response
+    mock_choice = MagicMock()
+    mock_choice.message = mock_message
 
-    @pytest.fixture
-    def llm_service(self):
-        """Create LLM service with mocked client"""
+    mock_response = MagicMock()
+    mock_response.choices = [mock_choice]
+
+    return mock_response
+
+
+def _completion(content, status_code=200):
+    """HTTP response carrying a chat completion with the given content"""
+    return httpx.Response(status_code, json={
+        "id": "test-completion",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "test-model",
+        "choices": [{
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": content},
+        }],
+    })
+
+
+RATE_LIMITED = httpx.Response(429, json={"error": {"message": "Rate limit exceeded"}})
+
+
+@pytest.fixture
+def llm_settings():
+    """Patch app.ml.llm.settings with the test OpenRouter configuration"""
+    with patch("app.ml.llm.settings") as mock_settings:
+        mock_settings.OPENROUTER_API_KEY = "test-key"
+        mock_settings.OPENROUTER_MODEL = "test-model"
+        mock_settings.OPENROUTER_BASE_URL = "https://test.api"
+        yield mock_settings
+
+
+@pytest.fixture(scope="module")
+def openai_router():
+    """respx router answering the SDK's requests (routes added per test)"""
+    return respx.Router(assert_all_called=False)
+
+
+@pytest.fixture(scope="module")
+def openai_client(openai_router):
+    """Real AsyncOpenAI client, built once, pointed at the mocked base URL"""
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(openai_router.async_handler))
+    return AsyncOpenAI(
+        api_key="test-key", base_url=MOCK_BASE_URL, max_retries=0, http_client=http_client,
+    )
+
+
+class TestLLMService:
+    """Tests for LLMService class"""
+
+    @pytest.fixture(scope="class")
+    def llm_service(self, openai_client):
+        """Create LLM service with test settings and the shared client"""
         with patch("app.ml.llm.settings") as mock_settings:
             mock_settings.OPENROUTER_API_KEY = "test-key"
             mock_settings.OPENROUTER_MODEL = "test-model"
             mock_settings.OPENROUTER_BASE_URL = "https://test.api"
 
-            from app.ml.llm import LLMService
             service = LLMService()
-            service.client = AsyncMock()
-            return service
+        service.client = openai_client
+        return service
 
-    @pytest.mark.asyncio
-    async def test_generate_success(self, llm_service, mock_openai_response):
+    @pytest.fixture(autouse=True)
+    def _empty_json_cache(self, llm_service):
+        """No generate_json cache carried over between tests"""
+        llm_service._json_cache.clear()
+
+    @pytest.fixture
+    def completions(self, openai_router):
+        """Mocked /chat/completions route (responses set by each test)"""
+        yield openai_router.post(COMPLETIONS_URL)
+        openai_router.clear()
+        openai_router.reset()
+
+    async def test_generate_success(self, llm_service, completions):
         """Test successful text generation"""
-        llm_service.client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+        completions.mock(return_value=_completion("Test response"))
 
         result = await llm_service.generate("Test prompt")
 
         assert result == "Test response"
-        llm_service.client.chat.completions.create.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_generate_retry_on_rate_limit(self, llm_service, mock_openai_response):
-        """Test retry logic on rate limit errors"""
-        # First call raises RateLimitError, second succeeds
-        llm_service.client.chat.completions.create = AsyncMock(
-            side_effect=[
-                RateLimitError("Rate limit exceeded", response=MagicMock(), body={}),
-                mock_openai_response
-            ]
-        )
-
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            result = await llm_service.generate("Test prompt")
+        assert completions.call_count == 1
 
-        assert result == "Test response"
-        assert llm_service.client.chat.completions.create.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_generate_retry_on_connection_error(self, llm_service, mock_openai_response):
-        """Test retry logic on connection errors"""
-        llm_service.client.chat.completions.create = AsyncMock(
-            side_effect=[
-                APIConnectionError(request=MagicMock()),
-                mock_openai_response
-            ]
-        )
+    @pytest.mark.parametrize("failure", [
+        pytest.param(RATE_LIMITED, id="rate-limit"),                          # RateLimitError
+        pytest.param(httpx.ConnectError("Connection refused"), id="connection"),  # APIConnectionError
+        pytest.param(httpx.ReadTimeout("Timed out"), id="timeout"),           # APITimeoutError
+    ])
+    async def test_generate_retry(self, llm_service, completions, failure):
+        """Test retry logic on retryable failures: first call fails, second succeeds"""
+        completions.side_effect = [failure, _completion("Test response")]
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            result = await llm_service.generate("Test prompt")
+        result = await llm_service.generate("Test prompt")
 
         assert result == "Test response"
-        assert llm_service.client.chat.completions.create.call_count == 2
+        assert completions.call_count == 2
 
-    @pytest.mark.asyncio
-    async def test_generate_max_retries_exceeded(self, llm_service):
+    async def test_generate_max_retries_exceeded(self, llm_service, completions):
         """Test that generation raises after max retries are exhausted"""
-        llm_service.client.chat.completions.create = AsyncMock(
-            side_effect=RateLimitError("Rate limit exceeded", response=MagicMock(), body={})
-        )
+        completions.mock(return_value=RATE_LIMITED)
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            with pytest.raises((RateLimitError, Exception)):
-                await llm_service.generate("Test prompt")
+        with pytest.raises((RateLimitError, Exception)):
+            await llm_service.generate("Test prompt")
 
         # Should have retried MAX_RETRIES times before raising
-        assert llm_service.client.chat.completions.create.call_count >= 1
+        assert completions.call_count >= 1
 
-    @pytest.mark.asyncio
-    async def test_generate_json_success(self, llm_service):
+    async def test_generate_json_success(self, llm_service, completions):
         """Test successful JSON generation"""
-        mock_json_content = '{"title": "Test", "summary": "Test summary"}'
-        mock_message = MagicMock()
-        mock_message.content = mock_json_content
-        mock_choice = MagicMock()
-        mock_choice.message = mock_message
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
+        completions.mock(return_value=_completion('{"title": "Test", "summary": "Test summary"}'))
 
-        llm_service.client.chat.completions.create = AsyncMock(return_value=mock_response)
-
-        result = await llm_service.generate_json("Test prompt")
+        result = await llm_service.generate_json("Test prompt", temperature=0.0)
 
         assert result["title"] == "Test"
         assert result["summary"] == "Test summary"
 
-    @pytest.mark.asyncio
-    async def test_generate_json_invalid_response(self, llm_service):
-        """Test JSON generation with invalid JSON response"""
-        mock_message = MagicMock()
-        mock_message.content = "Not valid JSON"
-        mock_choice = MagicMock()
-        mock_choice.message = mock_message
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
+        # Same deterministic request again: served from the cache, as a fresh dict
+        result["title"] = "Mutated"
+        llm_service._last_generation_cost = 0.5  # cost of some other, earlier call
+        cached = await llm_service.generate_json("Test prompt", temperature=0.0)
 
-        llm_service.client.chat.completions.create = AsyncMock(return_value=mock_response)
+        assert cached["title"] == "Test"
+        assert completions.call_count == 1
+        assert llm_service.get_last_generation_cost() == 0.0
 
-        result = await llm_service.generate_json("Test prompt")
+    async def test_generate_json_sampled_not_cached(self, llm_service, completions):
+        """Sampled (temperature > 0) requests always reach the API by default"""
+        completions.mock(return_value=_completion('{"title": "Test"}'))
+
+        await llm_service.generate_json("Test prompt", temperature=0.6)
+        await llm_service.generate_json("Test prompt", temperature=0.6)
+
+        assert completions.call_count == 2
+        assert not llm_service._json_cache
+
+    async def test_generate_json_cache_expires(self, llm_service, completions, monkeypatch):
+        """Cached responses older than the TTL are fetched again"""
+        completions.mock(return_value=_completion('{"title": "Test"}'))
 
-        # Should return fallback structure
+        await llm_service.generate_json("Test prompt", use_cache=True)
+        monkeypatch.setattr("app.ml.llm.JSON_CACHE_TTL_SECONDS", -1.0)
+        await llm_service.generate_json("Test prompt", use_cache=True)
+
+        assert completions.call_count == 2
+
+    async def test_generate_json_invalid_response(self, llm_service, completions):
+        """Test JSON generation with invalid JSON response"""
+        completions.mock(return_value=_completion("Not valid JSON"))
+
+        result = await llm_service.generate_json("Test prompt", use_cache=True)
+
+        # Should return fallback structure (and not cache it)
         assert "title" in result
         assert "summary" in result
+        assert not llm_service._json_cache
+
+    async def test_generate_json_embedded_object(self, llm_service, completions):
+        """Test JSON generation recovers an object wrapped in prose"""
+        completions.mock(return_value=_completion('Voici : {"title": "x", "summary": "y"} Fin.'))
 
-    @pytest.mark.asyncio
-    async def test_generate_with_custom_temperature(self, llm_service, mock_openai_response):
+        result = await llm_service.generate_json("Test prompt")
+
+        assert result["title"] == "x"
+        assert result["summary"] == "y"
+
+    async def test_generate_with_custom_temperature(self, llm_service, completions):
         """Test generation with custom temperature"""
-        llm_service.client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+        completions.mock(return_value=_completion("Test response"))
 
         await llm_service.generate("Test prompt", temperature=0.9)
 
-        call_args = llm_service.client.chat.completions.create.call_args
-        assert call_args.kwargs["temperature"] == 0.9
+        body = json.loads(completions.calls.last.request.content)
+        assert body["temperature"] == 0.9
 
-    @pytest.mark.asyncio
-    async def test_generate_with_custom_max_tokens(self, llm_service, mock_openai_response):
+    async def test_generate_with_custom_max_tokens(self, llm_service, completions):
         """Test generation with custom max tokens"""
-        llm_service.client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+        completions.mock(return_value=_completion("Test response"))
 
         await llm_service.generate("Test prompt", max_tokens=4000)
 
-        call_args = llm_service.client.chat.completions.create.call_args
-        assert call_args.kwargs["max_tokens"] == 4000
+        body = json.loads(completions.calls.last.request.content)
+        assert body["max_tokens"] == 4000
 
 
+@pytest.mark.usefixtures("llm_settings")
 class TestLLMServiceInitialization:
     """Tests for LLM service initialization"""
 
-    @pytest.mark.asyncio
     async def test_initialize_creates_client(self):
         """Test that initialize creates OpenAI client"""
-        with patch("app.ml.llm.settings") as mock_settings, \
-             patch("app.ml.llm.AsyncOpenAI") as mock_openai:
-            mock_settings.OPENROUTER_API_KEY = "test-key"
-            mock_settings.OPENROUTER_MODEL = "test-model"
-            mock_settings.OPENROUTER_BASE_URL = "https://test.api"
-
-            from app.ml.llm import LLMService
+        with patch("app.ml.llm.AsyncOpenAI") as mock_openai:
             service = LLMService()
             await service.initialize()
 
             mock_openai.assert_called_once()
             assert service.client is not None
 
-    @pytest.mark.asyncio
     async def test_generate_auto_initializes(self):
         """Test that generate initializes client if not done"""
-        with patch("app.ml.llm.settings") as mock_settings, \
-             patch("app.ml.llm.AsyncOpenAI") as mock_openai:
-            mock_settings.OPENROUTER_API_KEY = "test-key"
-            mock_settings.OPENROUTER_MODEL = "test-model"
-            mock_settings.OPENROUTER_BASE_URL = "https://test.api"
-
-            mock_message = MagicMock()
-            mock_message.content = "Response"
-            mock_choice = MagicMock()
-            mock_choice.message = mock_message
-            mock_response = MagicMock()
-            mock_response.choices = [mock_choice]
-
+        with patch("app.ml.llm.AsyncOpenAI") as mock_openai:
             mock_client = AsyncMock()
-            mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+            mock_client.chat.completions.create = AsyncMock(return_value=_chat_response("Response"))
             mock_openai.return_value = mock_client
 
-            from app.ml.llm import LLMService
             service = LLMService()
 
             result = await service.generate("Test")
@@ -2,108 +2,85 @@
 Search API Tests - NovaPress AI v2
 Tests for text search and semantic search functionality
 """
+import asyncio
+
 import pytest
 from fastapi import status
 
+# Read-only endpoint tests: all share the session-scoped async_client and its loop
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.xdist_group(name=__name__),  # one worker: one app + client, rate limiter state
+]
+
+
+# (case id, query string, accepted status codes, max results when 200)
+SEARCH_CASES = [
+    ("query", "?q=technology", [status.HTTP_200_OK], None),
+    ("empty-query", "?q=", [  # empty results or rejected
+        status.HTTP_200_OK,
+        status.HTTP_400_BAD_REQUEST,
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+    ], None),
+    ("no-query-param", "", [  # missing q: error or empty results
+        status.HTTP_200_OK,
+        status.HTTP_400_BAD_REQUEST,
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+    ], None),
+    ("limit", "?q=news&limit=5", [status.HTTP_200_OK], 5),
+    ("special-characters", "?q=test%20%26%20news", [  # "test & news", handled gracefully
+        status.HTTP_200_OK,
+        status.HTTP_400_BAD_REQUEST,
+    ], None),
+    ("unicode", "?q=économie%20française", [status.HTTP_200_OK], None),
+    ("long-query", "?q=" + "a" * 500, [  # handled or rejected gracefully
+        status.HTTP_200_OK,
+        status.HTTP_400_BAD_REQUEST,
+        status.HTTP_414_REQUEST_URI_TOO_LONG,
+        status.HTTP_422_UNPROCESSABLE_ENTITY,
+    ], None),
+]
+
+
+def _check_search_response(response, max_results):
+    """Shape checks for a search response (200 only)"""
+    if response.status_code != status.HTTP_200_OK:
+        return
+
+    data = response.json()
+
+    # Should return results or empty list
+    assert isinstance(data, (list, dict))
+    if isinstance(data, dict):
+        assert "data" in data or "results" in data or "articles" in data
+
+    results = data.get("data", data) if isinstance(data, dict) else data
+    if max_results is not None and isinstance(results, list):
+        assert len(results) <= max_results
+
 
 class TestTextSearch:
     """Tests for text-based search endpoint"""
-    
-    @pytest.mark.unit
-    def test_search_with_query(self, client):
-        """Test search with a valid query"""
-        response = client.get("/api/search?q=technology")
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        
-        # Should return results or empty list
-        assert isinstance(data, (list, dict))
-        if isinstance(data, dict):
-            assert "data" in data or "results" in data or "articles" in data
-    
-    @pytest.mark.unit
-    def test_search_empty_query(self, client):
-        """Test search with empty query"""
-        response = client.get("/api/search?q=")
-        
-        # Should return empty results, validation error, or bad request
-        assert response.status_code in [
-            status.HTTP_200_OK,
-            status.HTTP_400_BAD_REQUEST,
-            status.HTTP_422_UNPROCESSABLE_ENTITY,
-        ]
-        
-        if response.status_code == 200:
-            data = response.json()
-            results = data.get("data", data) if isinstance(data, dict) else data
-            if isinstance(results, list):
-                assert len(results) == 0 or isinstance(results, list)
-    
-    @pytest.mark.unit
-    def test_search_no_query_param(self, client):
-        """Test search without query parameter"""
-        response = client.get("/api/search")
-        
-        # Should return error or empty results
-        assert response.status_code in [
-            status.HTTP_200_OK,
-            status.HTTP_400_BAD_REQUEST,
-            status.HTTP_422_UNPROCESSABLE_ENTITY
-        ]
-    
-    @pytest.mark.unit
-    def test_search_with_limit(self, client):
-        """Test search with limit parameter"""
-        response = client.get("/api/search?q=news&limit=5")
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        
-        results = data.get("data", data) if isinstance(data, dict) else data
-        if isinstance(results, list):
-            assert len(results) <= 5
-    
-    @pytest.mark.unit
-    def test_search_special_characters(self, client):
-        """Test search with special characters"""
-        response = client.get("/api/search?q=test%20%26%20news")  # "test & news"
-        
-        # Should handle gracefully
-        assert response.status_code in [
-            status.HTTP_200_OK,
-            status.HTTP_400_BAD_REQUEST
-        ]
-    
-    @pytest.mark.unit
-    def test_search_unicode_query(self, client):
-        """Test search with unicode characters (French)"""
-        response = client.get("/api/search?q=économie%20française")
-        
-        assert response.status_code == status.HTTP_200_OK
-    
+
     @pytest.mark.unit
-    def test_search_long_query(self, client):
-        """Test search with very long query"""
-        long_query = "a" * 500
-        response = client.get(f"/api/search?q={long_query}")
-        
-        # Should handle or reject gracefully
-        assert response.status_code in [
-            status.HTTP_200_OK,
-            status.HTTP_400_BAD_REQUEST,
-            status.HTTP_414_REQUEST_URI_TOO_LONG,
-            status.HTTP_422_UNPROCESSABLE_ENTITY
-        ]
+    async def test_search_matrix(self, async_client):
+        """Test all SEARCH_CASES at once: the requests are issued concurrently"""
+        responses = await asyncio.gather(*(
+            async_client.get(f"/api/search{query}") for _, query, _, _ in SEARCH_CASES
+        ))
+
+        for (case_id, _, ok_codes, max_results), response in zip(SEARCH_CASES, responses):
+            assert response.status_code in ok_codes, case_id
+            _check_search_response(response, max_results)
 
 
 class TestSemanticSearch:
     """Tests for semantic/vector search (if available)"""
     
     @pytest.mark.unit
-    def test_semantic_search_endpoint(self, client):
+    async def test_semantic_search_endpoint(self, async_client):
         """Test semantic search endpoint exists"""
-        response = client.get("/api/search/semantic?q=artificial%20intelligence")
+        response = await async_client.get("/api/search/semantic?q=artificial%20intelligence")
         
         # Endpoint may not exist, so 404 is acceptable
         assert response.status_code in [
@@ -116,9 +93,9 @@ class TestSearchResultStructure:
     """Tests for search result structure"""
     
     @pytest.mark.unit
-    def test_search_result_structure(self, client):
+    async def test_search_result_structure(self, async_client):
         """Test that search results have expected structure"""
-        response = client.get("/api/search?q=test")
+        response = await async_client.get("/api/search?q=test")
         
         if response.status_code != 200:
             pytest.skip("Search returned non-200 status")
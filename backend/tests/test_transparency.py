@@ -2,10 +2,16 @@
 
 import sys
 import os
+
+import pytest
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from app.ml.transparency_score import TransparencyScorer
 
+# Pure-CPU and fast: keep the whole module on one xdist worker
+pytestmark = pytest.mark.xdist_group(name=__name__)
+
 
 def make_synthesis(num_sources=3, source_articles=None, contradictions_count=0, has_contradictions=False):
     """Helper to create a test synthesis dict."""
@@ -37,15 +43,26 @@ def make_articles(domains=None):
     ]
 
 
+# Default inputs, built once and shared: the scorer only reads them
+@pytest.fixture(scope="module")
+def default_synthesis():
+    return make_synthesis()
+
+
+@pytest.fixture(scope="module")
+def default_articles():
+    return tuple(make_articles())
+
+
 class TestTransparencyScorer:
-    def setup_method(self):
-        self.scorer = TransparencyScorer()
+    @classmethod
+    def setup_class(cls):
+        # Stateless scorer: one instance for the whole class
+        cls.scorer = TransparencyScorer()
 
-    def test_basic_score_calculation(self):
+    def test_basic_score_calculation(self, default_synthesis, default_articles):
         """Score should be between 0 and 100."""
-        synthesis = make_synthesis(num_sources=3)
-        articles = make_articles()
-        result = self.scorer.calculate(synthesis, articles)
+        result = self.scorer.calculate(default_synthesis, default_articles)
 
         assert 0 <= result["score"] <= 100
         assert result["label"] in ("Excellent", "Bon", "Moyen", "Faible")
@@ -74,22 +91,19 @@ class TestTransparencyScorer:
 
         assert high_result["score"] > low_result["score"]
 
-    def test_contradictions_boost_transparency(self):
+    def test_contradictions_boost_transparency(self, default_articles):
         """Detected and disclosed contradictions should score higher."""
         no_contradiction = make_synthesis(contradictions_count=0)
         has_contradiction = make_synthesis(contradictions_count=2, has_contradictions=True)
-        articles = make_articles()
 
-        no_result = self.scorer.calculate(no_contradiction, articles)
-        yes_result = self.scorer.calculate(has_contradiction, articles)
+        no_result = self.scorer.calculate(no_contradiction, default_articles)
+        yes_result = self.scorer.calculate(has_contradiction, default_articles)
 
         assert yes_result["breakdown"]["contradictions"]["score"] > no_result["breakdown"]["contradictions"]["score"]
 
-    def test_breakdown_has_all_components(self):
+    def test_breakdown_has_all_components(self, default_synthesis, default_articles):
         """Breakdown should contain all 5 scoring components."""
-        synthesis = make_synthesis()
-        articles = make_articles()
-        result = self.scorer.calculate(synthesis, articles)
+        result = self.scorer.calculate(default_synthesis, default_articles)
 
         expected_keys = {"source_diversity", "language_diversity", "contradictions", "fact_density", "geo_coverage"}
         assert set(result["breakdown"].keys()) == expected_keys
@@ -99,11 +113,9 @@ class TestTransparencyScorer:
             assert "weight" in component, f"Missing weight in {key}"
             assert "detail" in component, f"Missing detail in {key}"
 
-    def test_weights_sum_to_100(self):
+    def test_weights_sum_to_100(self, default_synthesis, default_articles):
         """Component weights should sum to 100."""
-        synthesis = make_synthesis()
-        articles = make_articles()
-        result = self.scorer.calculate(synthesis, articles)
+        result = self.scorer.calculate(default_synthesis, default_articles)
 
         total_weight = sum(c["weight"] for c in result["breakdown"].values())
         assert total_weight == 100
@@ -131,13 +143,11 @@ class TestTransparencyScorer:
         assert 0 <= result["score"] <= 100
         assert result["label"] in ("Excellent", "Bon", "Moyen", "Faible")
 
-    def test_rag_analysis_override(self):
+    def test_rag_analysis_override(self, default_synthesis, default_articles):
         """RAG analysis data should be used when provided."""
-        synthesis = make_synthesis()
-        articles = make_articles()
         rag = {"contradictions_count": 5, "fact_density": 0.9}
 
-        result = self.scorer.calculate(synthesis, articles, rag)
+        result = self.scorer.calculate(default_synthesis, default_articles, rag)
         assert result["breakdown"]["fact_density"]["score"] == 90  # 0.9 * 100
 
     def test_language_detection_from_domains(self):